@@ -1,13 +1,23 @@
 # -*- coding: utf-8 -*-
 
 import os
+import atexit
+import copy
 import logging
+import logging.handlers
+import queue
+from typing import Optional
 from dotenv import load_dotenv
-from pythonjsonlogger import jsonlogger
+from pythonjsonlogger.orjson import OrjsonFormatter
 from context import RequestIdFilter
 
 # --- ЗАГРУЗКА ПЕРЕМЕННЫХ ОКРУЖЕНИЯ ---
-load_dotenv()
+# .env читается один раз; флаг модуля сохраняется и при importlib.reload,
+# окружение процесса служебными переменными не засоряется
+_dotenv_loaded: bool = globals().get("_dotenv_loaded", False)
+if not _dotenv_loaded:
+    load_dotenv()
+    _dotenv_loaded = True
 
 # --- КОНФИГУРАЦИЯ БОТА ---
 BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN", None)
@@ -16,33 +26,75 @@ DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///data/hebrew_helper_cache.db"
 
 # --- НАСТРОЙКИ ПАРСЕРА И БД ---
 PARSING_TIMEOUT = 15
-DB_READ_ATTEMPTS = 5
-DB_READ_DELAY = 0.2
 CONVERSATION_TIMEOUT_SECONDS = 1800  # 30 минут
-VERB_TRAINER_RETRY_ATTEMPTS = 3
 DICT_WORDS_PER_PAGE = 5  # <--- ДОБАВЛЕНА КОНСТАНТА
+# Пул соединений PostgreSQL: минимум держится открытым, максимум ограничивает
+# число одновременных соединений к серверу
+DB_POOL_MIN_SIZE = int(os.getenv("DB_POOL_MIN_SIZE", "1"))
+DB_POOL_MAX_SIZE = int(os.getenv("DB_POOL_MAX_SIZE", "10"))
+# Сколько обновлений Telegram обрабатывается одновременно (обновления одного
+# чата все равно выполняются по очереди)
+MAX_CONCURRENT_UPDATES = int(os.getenv("MAX_CONCURRENT_UPDATES", "64"))
 
 # --- НАСТРОЙКА ЛОГИРОВАНИЯ ---
 
-request_id_filter = RequestIdFilter()
+logger = logging.getLogger(__name__)
 
-LOG_LEVEL_NAME = os.getenv("LOG_LEVEL", "INFO").upper()
-LOG_LEVEL = logging.getLevelName(LOG_LEVEL_NAME)
-if not isinstance(LOG_LEVEL, int):
-    print(f"Warning: Invalid log level '{LOG_LEVEL_NAME}'. Defaulting to INFO.")
-    LOG_LEVEL = logging.INFO
-logHandler = logging.StreamHandler()
-formatter = jsonlogger.JsonFormatter(
-    "%(asctime)s %(name)s %(levelname)s %(message)s", json_ensure_ascii=False
-)
-logHandler.setFormatter(formatter)
 
-logger = logging.getLogger(__name__)
-logger.addHandler(logHandler)
-logger.setLevel(LOG_LEVEL)
-logger.addFilter(request_id_filter)
-logger.info(f"Logging level set to {LOG_LEVEL_NAME}")
-logging.getLogger("httpx").setLevel(logging.WARNING)
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    Кладет запись в очередь без форматирования: JSON-сериализация и запись
+    в поток выполняются в потоке QueueListener, а не в обработчике апдейта.
+    """
+
+    def prepare(self, record):
+        # Подставляем аргументы сразу, пока объекты не изменились
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def configure_logging() -> None:
+    """
+    Настраивает JSON-логирование бота. Вызывается один раз из точки входа,
+    а не при импорте, чтобы тесты и утилиты не запускали поток логирования.
+    """
+    global _log_listener
+    if _log_listener is not None:
+        return
+
+    log_level_name = os.getenv("LOG_LEVEL", "INFO").upper()
+    log_level = logging.getLevelName(log_level_name)
+    if not isinstance(log_level, int):
+        print(f"Warning: Invalid log level '{log_level_name}'. Defaulting to INFO.")
+        log_level = logging.INFO
+
+    log_handler = logging.StreamHandler()
+    # orjson сериализует запись в C и сразу пишет не-ASCII символы как есть
+    log_handler.setFormatter(
+        OrjsonFormatter("%(asctime)s %(name)s %(levelname)s %(message)s")
+    )
+
+    queue_handler = DeferredQueueHandler(queue.SimpleQueue())
+    # Фильтр висит на обработчике, а не на логгере: он вызывается только для
+    # записей, прошедших проверку уровня. Это должен быть именно queue_handler -
+    # он работает в контексте обработчика апдейта, где ContextVar еще содержат
+    # данные запроса.
+    queue_handler.addFilter(RequestIdFilter())
+    _log_listener = logging.handlers.QueueListener(
+        queue_handler.queue, log_handler, respect_handler_level=True
+    )
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+
+    logger.addHandler(queue_handler)
+    logger.setLevel(log_level)
+    logger.info(f"Logging level set to {log_level_name}")
+    logging.getLogger("httpx").setLevel(logging.WARNING)
 
 
 # --- СОСТОЯНИЯ ДЛЯ CONVERSATION HANDLER ---
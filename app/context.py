@@ -14,8 +14,15 @@ class RequestIdFilter(logging.Filter):
     Этот фильтр добавляет request_id из ContextVar в каждую запись лога.
     """
 
+    def __init__(self, name=""):
+        super().__init__(name)
+        # Связанные методы сохраняем один раз, чтобы не искать их на каждую запись
+        self._get_request_id = request_id_var.get
+        self._get_username = username_var.get
+        self._get_handler_name = handler_name_var.get
+
     def filter(self, record):
-        record.request_id = request_id_var.get()
-        record.username = username_var.get()
-        record.handler_name = handler_name_var.get()
+        record.request_id = self._get_request_id()
+        record.username = self._get_username()
+        record.handler_name = self._get_handler_name()
         return True
@@ -1,9 +1,10 @@
 # -*- coding: utf-8 -*-
 
-from typing import List, Optional, Dict, Literal, Union
-from pydantic import BaseModel
+from typing import List, Optional, Dict, Literal, Tuple, Union
+from pydantic import BaseModel, ConfigDict
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 
 
 class PartOfSpeech(str, Enum):
@@ -54,7 +55,20 @@ class Binyan(str, Enum):
     HUFAL = "hufal"
 
 
+# Таблицы "значение -> член Enum": поиск в dict вместо вызова Enum("value")
+# при сборке моделей из строк БД.
+PART_OF_SPEECH_BY_VALUE: Dict[str, PartOfSpeech] = {m.value: m for m in PartOfSpeech}
+GENDER_BY_VALUE: Dict[str, Gender] = {m.value: m for m in Gender}
+TENSE_BY_VALUE: Dict[str, Tense] = {m.value: m for m in Tense}
+PERSON_BY_VALUE: Dict[str, Person] = {m.value: m for m in Person}
+BINYAN_BY_VALUE: Dict[str, Binyan] = {m.value: m for m in Binyan}
+
+
 class Translation(BaseModel):
+    # Переводы и спряжения из БД разделяются между запросами через кэш слов,
+    # поэтому они неизменяемы.
+    model_config = ConfigDict(frozen=True)
+
     translation_id: int
     word_id: int
     translation_text: str
@@ -63,6 +77,8 @@ class Translation(BaseModel):
 
 
 class VerbConjugation(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: int
     word_id: int
     tense: Tense
@@ -91,6 +107,17 @@ class CachedWord(BaseModel):
     masculine_plural: Optional[str] = None
     feminine_plural: Optional[str] = None
 
+    @property
+    def primary_translation_text(self) -> str:
+        """
+        Текст основного перевода или пустая строка. Репозиторий отдает
+        переводы основным первым, так что поиск обычно завершается на первом.
+        """
+        for translation in self.translations:
+            if translation.is_primary:
+                return translation.translation_text
+        return ""
+
 
 class CreateTranslation(BaseModel):
     """Модель для данных о новом переводе."""
@@ -171,14 +198,37 @@ class UserSettings(BaseModel):
     tense_settings: Optional[List[UserTenseSetting]] = None
     use_grammatical_forms: bool = False
 
-    def get_active_tenses(self) -> List[str]:
-        """Возвращает список активных времен в виде строк."""
-        return [
-            setting.tense.value for setting in self.tense_settings if setting.is_active
-        ]
+    # Результаты вычисляются один раз на объект: при изменении настроек
+    # репозиторий всегда создает новый объект UserSettings.
+    @cached_property
+    def active_tenses(self) -> Tuple[str, ...]:
+        return tuple(
+            setting.tense.value
+            for setting in self.tense_settings or ()
+            if setting.is_active
+        )
+
+    @cached_property
+    def settings_dict(self) -> Dict[str, bool]:
+        return {
+            setting.tense.value: setting.is_active
+            for setting in self.tense_settings or ()
+        }
+
+    def get_active_tenses(self) -> Tuple[str, ...]:
+        """Возвращает активные времена в виде кортежа строк."""
+        return self.active_tenses
 
     def get_settings_as_dict(self) -> Dict[str, bool]:
         """Возвращает настройки в виде словаря. Удобно для быстрой проверки."""
-        return {
-            setting.tense.value: setting.is_active for setting in self.tense_settings
-        }
+        return self.settings_dict
+
+    def with_tense_settings(
+        self, tense_settings: List[UserTenseSetting]
+    ) -> "UserSettings":
+        """Возвращает новый объект с другими настройками времен."""
+        return UserSettings(
+            user_id=self.user_id,
+            tense_settings=tense_settings or None,
+            use_grammatical_forms=self.use_grammatical_forms,
+        )
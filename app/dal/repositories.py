@@ -1,10 +1,15 @@
 # -*- coding: utf-8 -*-
 import random
-from typing import Optional, List, Any, Dict, Tuple
+from collections import defaultdict
+from functools import lru_cache, partial
+from typing import Optional, List, Any, Callable, Dict, Hashable, Sequence, Set, Tuple
 from datetime import datetime
 
-from psycopg2.extras import DictRow
+import orjson
+from psycopg2.extensions import cursor as psycopg2_cursor
+from psycopg2.extras import execute_values
 
+from dal.cache import CacheInfo, LRUCache
 from dal.models import (
     CachedWord,
     CreateCachedWord,
@@ -14,139 +19,745 @@ from dal.models import (
     UserTenseSetting,
     Tense,
     PartOfSpeech,
+    PART_OF_SPEECH_BY_VALUE,
+    GENDER_BY_VALUE,
+    TENSE_BY_VALUE,
+    PERSON_BY_VALUE,
+    BINYAN_BY_VALUE,
 )
 from services.connection import Connection
 
 
+def _to_datetime(value: Any) -> datetime:
+    # SQLite возвращает TIMESTAMP строкой, PostgreSQL - готовым datetime
+    return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+
+# model_construct не приводит типы, поэтому поля, которые БД отдает "сырыми"
+# (строки вместо Enum, 0/1 вместо bool в SQLite), конвертируем вручную.
+_FIELD_CONVERTERS = {
+    CachedWord: {
+        "part_of_speech": PART_OF_SPEECH_BY_VALUE.__getitem__,
+        "binyan": BINYAN_BY_VALUE.__getitem__,
+        "gender": GENDER_BY_VALUE.__getitem__,
+        "fetched_at": _to_datetime,
+    },
+    Translation: {"is_primary": bool},
+    VerbConjugation: {
+        "tense": TENSE_BY_VALUE.__getitem__,
+        "person": PERSON_BY_VALUE.__getitem__,
+    },
+}
+
+
+# Слова с pealim.com не меняются после сохранения, поэтому собранные CachedWord
+# можно переиспользовать между запросами. Кэш общий для всех соединений.
+_WORD_CACHE_MAXSIZE = 4096
+_word_cache = LRUCache(maxsize=_WORD_CACHE_MAXSIZE)
+# Отдельный кэш для get_word_hebrew_by_id: карточки спряжений запрашивают
+# только заголовок слова, без переводов и спряжений.
+_word_hebrew_cache = LRUCache(maxsize=_WORD_CACHE_MAXSIZE)
+# Нормализованная форма -> ID найденных слов. Новое слово может добавить
+# совпадение к любой форме (через спряжения), поэтому при создании слов кэш
+# сбрасывается целиком; пустые результаты не кэшируются.
+_word_ids_by_form_cache = LRUCache(maxsize=_WORD_CACHE_MAXSIZE)
+# Кэши общие, поэтому прочитанное внутри транзакции попадает в них только после
+# коммита (см. BaseRepository._cache_put): после отката в кэше не остается
+# слов, которых нет в БД.
+
+
+def _invalidate_cached_words(word_ids: Sequence[int]) -> None:
+    for word_id in word_ids:
+        _word_cache.pop(word_id)
+        _word_hebrew_cache.pop(word_id)
+    _word_ids_by_form_cache.cache_clear()
+
+
+def _is_stale_after_insert(cache_write: Callable[[], None], word_ids: Set[int]) -> bool:
+    """Отложенная запись, которую делает устаревшей вставка слов word_ids."""
+    if not isinstance(cache_write, partial):
+        return False
+    if cache_write.func == _word_ids_by_form_cache.put:
+        return True
+    return (
+        cache_write.func in (_word_cache.put, _word_hebrew_cache.put)
+        and cache_write.args[0] in word_ids
+    )
+
+
+# Колонки cached_words в порядке полей CachedWord (без вложенных списков).
+# Вместо SELECT * выбираем ровно то, что нужно модели.
+_CACHED_WORD_COLUMNS = (
+    "word_id",
+    "hebrew",
+    "normalized_hebrew",
+    "transcription",
+    "part_of_speech",
+    "root",
+    "binyan",
+    "fetched_at",
+    "gender",
+    "singular_form",
+    "plural_form",
+    "masculine_singular",
+    "feminine_singular",
+    "masculine_plural",
+    "feminine_plural",
+)
+
+
+def _columns_sql(columns: Sequence[str], alias: str) -> str:
+    return ", ".join(f"{alias}.{column}" for column in columns)
+
+
+_W_COLUMNS = _columns_sql(_CACHED_WORD_COLUMNS, "w")
+_CW_COLUMNS = _columns_sql(_CACHED_WORD_COLUMNS, "cw")
+
+# Переводы и спряжения слова собираются в JSON-массивы прямо в БД: одна строка
+# на слово вместо декартова произведения переводов и спряжений при двух JOIN.
+_TRANSLATION_JSON_FIELDS = (
+    "translation_id",
+    "translation_text",
+    "context_comment",
+    "is_primary",
+)
+_CONJUGATION_JSON_FIELDS = (
+    "id",
+    "tense",
+    "person",
+    "hebrew_form",
+    "normalized_hebrew_form",
+    "transcription",
+)
+
+
+def _json_object_args(fields: Sequence[str]) -> str:
+    return ", ".join(f"'{field}', {field}" for field in fields)
+
+
+_SELECT_WORD_WITH_RELATIONS = {
+    # PostgreSQL: json_agg поддерживает ORDER BY, psycopg2 сам разбирает json
+    True: f"""
+        SELECT {_W_COLUMNS},
+               COALESCE(
+                   (SELECT json_agg(
+                               json_build_object({_json_object_args(_TRANSLATION_JSON_FIELDS)})
+                               ORDER BY is_primary DESC, translation_id)
+                    FROM translations WHERE word_id = w.word_id),
+                   '[]'::json) AS translations_json,
+               COALESCE(
+                   (SELECT json_agg(
+                               json_build_object({_json_object_args(_CONJUGATION_JSON_FIELDS)})
+                               ORDER BY id)
+                    FROM verb_conjugations WHERE word_id = w.word_id),
+                   '[]'::json) AS conjugations_json
+        FROM cached_words w
+    """,
+    # SQLite: порядок задается подзапросом, результат приходит строкой
+    False: f"""
+        SELECT {_W_COLUMNS},
+               (SELECT json_group_array(
+                           json_object({_json_object_args(_TRANSLATION_JSON_FIELDS)}))
+                FROM (SELECT {", ".join(_TRANSLATION_JSON_FIELDS)}
+                      FROM translations WHERE word_id = w.word_id
+                      ORDER BY is_primary DESC, translation_id)
+               ) AS translations_json,
+               (SELECT json_group_array(
+                           json_object({_json_object_args(_CONJUGATION_JSON_FIELDS)}))
+                FROM (SELECT {", ".join(_CONJUGATION_JSON_FIELDS)}
+                      FROM verb_conjugations WHERE word_id = w.word_id
+                      ORDER BY id)
+               ) AS conjugations_json
+        FROM cached_words w
+    """,
+}
+_PARAM_STYLE = {True: "%s", False: "?"}
+_WORD_WITH_RELATIONS_SQL = {
+    is_postgres: select + f"WHERE w.word_id = {_PARAM_STYLE[is_postgres]}"
+    for is_postgres, select in _SELECT_WORD_WITH_RELATIONS.items()
+}
+# Совпадения и по основной форме слова, и по формам спряжений
+_WORDS_WITH_RELATIONS_BY_FORM_SQL = {
+    is_postgres: select + """
+        WHERE w.word_id IN (
+            SELECT word_id FROM cached_words WHERE normalized_hebrew = {p}
+            UNION
+            SELECT word_id FROM verb_conjugations WHERE normalized_hebrew_form = {p}
+        )
+        ORDER BY w.word_id
+    """.format(p=_PARAM_STYLE[is_postgres])
+    for is_postgres, select in _SELECT_WORD_WITH_RELATIONS.items()
+}
+
+
+def _load_json_array(value: Any) -> List[Dict[str, Any]]:
+    if value is None:
+        return []
+    return orjson.loads(value) if isinstance(value, (str, bytes)) else value
+
+
+@lru_cache(maxsize=32)
+def _placeholders(param_style: str, count: int) -> str:
+    """Список плейсхолдеров для IN (...) и VALUES (...): количество невелико."""
+    return ", ".join([param_style] * count)
+
+
+def _by_param_style(template: str) -> Dict[str, str]:
+    """Готовит SQL-шаблон с плейсхолдером {p} для обоих стилей параметров."""
+    return {style: template.format(p=style) for style in ("%s", "?")}
+
+
+# Ключ варианта INSERT для psycopg2.extras.execute_values: весь список
+# VALUES подставляется в один плейсхолдер %s.
+_VALUES_PLACEHOLDER = "values"
+
+_INSERT_TRANSLATION_SQL = {
+    **_by_param_style(
+        "INSERT INTO translations (word_id, translation_text, context_comment, is_primary) "
+        "VALUES ({p}, {p}, {p}, {p})"
+    ),
+    _VALUES_PLACEHOLDER: "INSERT INTO translations "
+    "(word_id, translation_text, context_comment, is_primary) VALUES %s",
+}
+_INSERT_CONJUGATION_SQL = {
+    **_by_param_style(
+        "INSERT INTO verb_conjugations "
+        "(word_id, tense, person, hebrew_form, normalized_hebrew_form, transcription) "
+        "VALUES ({p}, {p}, {p}, {p}, {p}, {p})"
+    ),
+    _VALUES_PLACEHOLDER: "INSERT INTO verb_conjugations "
+    "(word_id, tense, person, hebrew_form, normalized_hebrew_form, transcription) "
+    "VALUES %s",
+}
+
+# Короткие точечные запросы горячего пути собраны заранее: в методах не
+# форматируется f-строка на каждый вызов, а драйвер получает один и тот же
+# объект строки (кэш подготовленных выражений sqlite3 ищет по тексту).
+# Явные списки колонок: пакетные выборки читаются обычными кортежами
+# (без sqlite3.Row/DictRow), и порядок колонок должен быть известен заранее.
+_TRANSLATION_COLUMNS = ("word_id",) + _TRANSLATION_JSON_FIELDS
+_CONJUGATION_COLUMNS = ("word_id",) + _CONJUGATION_JSON_FIELDS
+_SELECT_TRANSLATIONS_SQL = _by_param_style(
+    f"SELECT {', '.join(_TRANSLATION_COLUMNS)} FROM translations "
+    "WHERE word_id = {p} ORDER BY is_primary DESC"
+)
+_SELECT_CONJUGATIONS_SQL = _by_param_style(
+    f"SELECT {', '.join(_CONJUGATION_COLUMNS)} FROM verb_conjugations "
+    "WHERE word_id = {p} ORDER BY id"
+)
+_SELECT_WORD_HEBREW_SQL = _by_param_style(
+    "SELECT hebrew FROM cached_words WHERE word_id = {p}"
+)
+_DELETE_DICTIONARY_WORD_SQL = _by_param_style(
+    "DELETE FROM user_dictionary WHERE user_id = {p} AND word_id = {p}"
+)
+_SELECT_SRS_LEVEL_SQL = _by_param_style(
+    "SELECT srs_level FROM user_dictionary WHERE user_id = {p} AND word_id = {p}"
+)
+_UPDATE_SRS_LEVEL_SQL = _by_param_style(
+    "UPDATE user_dictionary SET srs_level = {p}, next_review_at = {p} "
+    "WHERE user_id = {p} AND word_id = {p}"
+)
+
+_COUNT_USER_VERBS_SQL = _by_param_style("""
+    SELECT COUNT(*)
+    FROM user_dictionary ud
+    JOIN cached_words cw ON cw.word_id = ud.word_id
+    WHERE ud.user_id = {p} AND cw.part_of_speech = 'verb'
+    """)
+
+
+_SELECT_WORD_ID_BY_NORMALIZED_SQL = _by_param_style(
+    "SELECT word_id FROM cached_words WHERE normalized_hebrew = {p} LIMIT 1"
+)
+_SELECT_WORD_ID_BY_CONJUGATION_SQL = _by_param_style(
+    "SELECT word_id FROM verb_conjugations WHERE normalized_hebrew_form = {p} "
+    "LIMIT 1"
+)
+_INSERT_USER_SQL = {
+    True: "INSERT INTO users (user_id, first_name, username) VALUES (%s, %s, %s) "
+    "ON CONFLICT (user_id) DO NOTHING",
+    False: "INSERT OR IGNORE INTO users (user_id, first_name, username) "
+    "VALUES (?, ?, ?)",
+}
+# word_id - детерминированный порядок для слов с одинаковым added_at
+# (слова, добавленные в одной транзакции), иначе страницы "прыгают".
+# Сортировка совпадает с индексом idx_user_dictionary_user_added.
+_SELECT_DICTIONARY_PAGE_SQL = _by_param_style(f"SELECT {_CW_COLUMNS}" """
+    FROM cached_words cw
+    JOIN user_dictionary ud ON cw.word_id = ud.word_id
+    WHERE ud.user_id = {p}
+    ORDER BY ud.added_at DESC, ud.word_id DESC
+    LIMIT {p} OFFSET {p}
+    """)
+_COUNT_DICTIONARY_WORDS_SQL = _by_param_style(
+    "SELECT COUNT(*) FROM user_dictionary WHERE user_id = {p}"
+)
+_SELECT_TRAINING_WORDS_SQL = _by_param_style(f"SELECT {_CW_COLUMNS}" """
+    FROM cached_words cw
+    JOIN user_dictionary ud ON cw.word_id = ud.word_id
+    WHERE ud.user_id = {p}
+    ORDER BY ud.next_review_at ASC
+    LIMIT {p}
+    """)
+_COUNT_READY_WORDS_SQL = _by_param_style("""
+    SELECT COUNT(id) FROM user_dictionary
+    WHERE user_id = {p} AND next_review_at <= CURRENT_TIMESTAMP
+    """)
+_SELECT_READY_WORD_AT_OFFSET_SQL = _by_param_style("""
+    SELECT ud.word_id
+    FROM user_dictionary ud
+    WHERE ud.user_id = {p} AND ud.next_review_at <= CURRENT_TIMESTAMP
+    ORDER BY ud.next_review_at ASC
+    LIMIT 1 OFFSET {p}
+    """)
+# Настройки времен и режим тренировки читаются за один запрос: строки режима
+# отличаются пустым tense.
+_SELECT_USER_SETTINGS_SQL = _by_param_style("""
+    SELECT tense, is_active FROM user_tense_settings WHERE user_id = {p}
+    UNION ALL
+    SELECT NULL, use_grammatical_forms FROM user_settings WHERE user_id = {p}
+    """)
+_INIT_USER_SETTINGS_SQL = {
+    True: "INSERT INTO user_settings (user_id, use_grammatical_forms) "
+    "VALUES (%s, FALSE) ON CONFLICT (user_id) DO NOTHING",
+    False: "INSERT OR IGNORE INTO user_settings (user_id, use_grammatical_forms) "
+    "VALUES (?, 0)",
+}
+_TOGGLE_TENSE_SQL = _by_param_style(
+    "UPDATE user_tense_settings SET is_active = NOT is_active "
+    "WHERE user_id = {p} AND tense = {p}"
+)
+_TOGGLE_TRAINING_MODE_SQL = _by_param_style(
+    "UPDATE user_settings SET use_grammatical_forms = NOT use_grammatical_forms "
+    "WHERE user_id = {p}"
+)
+
+
+# Запросы с переменной длиной списка собираются один раз на каждую длину
+@lru_cache(maxsize=64)
+def _words_by_ids_sql(is_postgres: bool, count: int) -> str:
+    placeholders = _placeholders(_PARAM_STYLE[is_postgres], count)
+    return (
+        _SELECT_WORD_WITH_RELATIONS[is_postgres]
+        + f"WHERE w.word_id IN ({placeholders})"
+    )
+
+
+@lru_cache(maxsize=64)
+def _translations_by_word_ids_sql(param_style: str, count: int) -> str:
+    return (
+        f"SELECT {', '.join(_TRANSLATION_COLUMNS)} FROM translations "
+        f"WHERE word_id IN ({_placeholders(param_style, count)}) "
+        "ORDER BY word_id, is_primary DESC"
+    )
+
+
+def _user_verbs_with_tenses_from(param_style: str, count: int) -> str:
+    # Только глаголы, у которых есть хотя бы одна форма в активных временах
+    # (EXISTS идет по индексу idx_verb_conjugations_word_tense)
+    return (
+        "FROM user_dictionary ud "
+        "JOIN cached_words cw ON cw.word_id = ud.word_id "
+        f"WHERE ud.user_id = {param_style} AND cw.part_of_speech = 'verb' "
+        "AND EXISTS (SELECT 1 FROM verb_conjugations vc "
+        "WHERE vc.word_id = ud.word_id "
+        f"AND vc.tense IN ({_placeholders(param_style, count)}))"
+    )
+
+
+@lru_cache(maxsize=16)
+def _count_user_verbs_with_tenses_sql(param_style: str, count: int) -> str:
+    return "SELECT COUNT(*) " + _user_verbs_with_tenses_from(param_style, count)
+
+
+@lru_cache(maxsize=16)
+def _user_verb_id_with_tenses_at_offset_sql(param_style: str, count: int) -> str:
+    # Порядок по word_id идет по уникальному индексу (user_id, word_id)
+    return (
+        "SELECT ud.word_id "
+        + _user_verbs_with_tenses_from(param_style, count)
+        + f" ORDER BY ud.word_id LIMIT 1 OFFSET {param_style}"
+    )
+
+
+@lru_cache(maxsize=64)
+def _dictionary_word_ids_sql(param_style: str, count: int) -> str:
+    return (
+        "SELECT word_id FROM user_dictionary "
+        f"WHERE user_id = {param_style} "
+        f"AND word_id IN ({_placeholders(param_style, count)})"
+    )
+
+
+@lru_cache(maxsize=16)
+def _insert_word_sql(param_style: str, columns: Tuple[str, ...]) -> str:
+    # Набор колонок зависит от части речи (модели CreateVerb/CreateNoun/...).
+    # Время загрузки проставляет сама БД; RETURNING поддерживается и
+    # PostgreSQL, и SQLite >= 3.35.
+    return (
+        f"INSERT INTO cached_words ({', '.join(columns)}, fetched_at) "
+        f"VALUES ({_placeholders(param_style, len(columns))}, CURRENT_TIMESTAMP) "
+        "RETURNING word_id"
+    )
+
+
+# Времена, включенные у нового пользователя по умолчанию. Все строки
+# вставляются одним выражением из VALUES, без executemany; RETURNING отдает
+# вставленные строки, чтобы не перечитывать настройки.
+_DEFAULT_TENSES = (Tense.PAST, Tense.PRESENT, Tense.FUTURE, Tense.IMPERATIVE)
+_DEFAULT_TENSES_VALUES = ", ".join(f"('{tense.value}')" for tense in _DEFAULT_TENSES)
+_INIT_TENSE_SETTINGS_SQL = {
+    True: f"""
+        INSERT INTO user_tense_settings (user_id, tense, is_active)
+        SELECT %s, t.tense, TRUE FROM (VALUES {_DEFAULT_TENSES_VALUES}) AS t(tense)
+        ON CONFLICT (user_id, tense) DO NOTHING
+        RETURNING tense, is_active
+    """,
+    # SQLite не поддерживает имена колонок у VALUES: колонка называется column1
+    False: f"""
+        INSERT OR IGNORE INTO user_tense_settings (user_id, tense, is_active)
+        SELECT ?, column1, 1 FROM (VALUES {_DEFAULT_TENSES_VALUES})
+        RETURNING tense, is_active
+    """,
+}
+
+
+# Новое слово сразу готово к повторению: next_review_at = текущее время БД
+_INSERT_DICTIONARY_WORD_SQL = {
+    True: "INSERT INTO user_dictionary (user_id, word_id, next_review_at) "
+    "VALUES (%s, %s, CURRENT_TIMESTAMP) ON CONFLICT (user_id, word_id) DO NOTHING",
+    False: "INSERT OR IGNORE INTO user_dictionary (user_id, word_id, next_review_at) "
+    "VALUES (?, ?, CURRENT_TIMESTAMP)",
+}
+
+
 class BaseRepository:
-    def __init__(self, connection: Connection, is_postgres: bool = True):
+    def __init__(
+        self,
+        connection: Connection,
+        is_postgres: bool = True,
+        pending_cache_writes: Optional[List[Callable[[], None]]] = None,
+    ):
         self.connection = connection
         self.is_postgres = is_postgres
         self.param_style = "%s" if is_postgres else "?"
+        # Отложенные записи в кэши; UnitOfWork выполняет их после коммита и
+        # отбрасывает при откате. Без UnitOfWork кэш заполняется сразу.
+        self.pending_cache_writes = pending_cache_writes
+
+    def _cache_put(self, cache: LRUCache, key: Hashable, value: Any) -> None:
+        if self.pending_cache_writes is None:
+            cache.put(key, value)
+        else:
+            self.pending_cache_writes.append(partial(cache.put, key, value))
 
     def _row_to_model(self, row: Dict[str, Any], model_class):
-        # Преобразование DictRow от psycopg2 в стандартный dict
-        if isinstance(row, DictRow):
+        """
+        Создает модель из строки БД без валидации Pydantic.
+        Данные из БД считаются доверенными: схема уже гарантирует типы,
+        полная валидация остается только для данных от парсера.
+        Обычный dict считается собственностью вызывающего и дополняется
+        конвертерами на месте, без копирования.
+        """
+        if not row:
+            return None
+        converters = _FIELD_CONVERTERS.get(model_class)
+        # Преобразование DictRow от psycopg2 (и sqlite3.Row) в стандартный dict
+        if type(row) is not dict:
             row = dict(row)
-        return model_class(**row) if row else None
+        if converters:
+            for field, converter in converters.items():
+                value = row.get(field)
+                if value is not None:
+                    row[field] = converter(value)
+        return model_class.model_construct(**row)
+
+    def _tuple_cursor(self):
+        """Курсор, возвращающий строки обычными кортежами."""
+        if self.is_postgres:
+            return self.connection.cursor(cursor_factory=psycopg2_cursor)
+        cursor = self.connection.cursor()
+        cursor.row_factory = None
+        return cursor
 
-    def _rows_to_models(self, rows: List[Dict[str, Any]], model_class):
-        return [self._row_to_model(row, model_class) for row in rows] if rows else []
+    def _insert_many(self, cursor, queries: Dict[str, str], rows: List[tuple]):
+        """
+        Пакетная вставка строк. psycopg2 выполняет executemany построчно,
+        поэтому для PostgreSQL строки склеиваются в один INSERT ... VALUES
+        через execute_values; SQLite справляется с executemany сам.
+        """
+        if self.is_postgres:
+            execute_values(cursor, queries[_VALUES_PLACEHOLDER], rows, page_size=500)
+        else:
+            cursor.executemany(queries[self.param_style], rows)
+
+    def _rows_to_models(
+        self,
+        rows: Sequence[Any],
+        model_class,
+        columns: Optional[Sequence[str]] = None,
+    ):
+        # Тот же код, что и в _row_to_model, но без вызова метода и поиска
+        # конвертеров на каждую строку
+        if not rows:
+            return []
+        construct = model_class.model_construct
+        converters = tuple(_FIELD_CONVERTERS.get(model_class, {}).items())
+        # Порядок колонок одинаков для всех строк результата: имена берем один
+        # раз (или получаем явно для кортежей из _tuple_cursor), а значения
+        # строки склеиваем с ними через zip без поиска по имени.
+        if columns is None:
+            columns = tuple(rows[0].keys())
+        models = []
+        for row in rows:
+            data = dict(zip(columns, row))
+            for field, converter in converters:
+                value = data.get(field)
+                if value is not None:
+                    data[field] = converter(value)
+            models.append(construct(**data))
+        return models
 
 
 class WordRepository(BaseRepository):
+    @staticmethod
+    def cache_info() -> CacheInfo:
+        """Статистика кэша слов (для отладки)."""
+        return _word_cache.cache_info()
+
+    @staticmethod
+    def cache_clear() -> None:
+        """Сбрасывает кэш слов."""
+        _word_cache.cache_clear()
+        _word_hebrew_cache.cache_clear()
+        _word_ids_by_form_cache.cache_clear()
+
     def get_word_by_id(self, word_id: int) -> Optional[CachedWord]:
-        query = f"SELECT * FROM cached_words WHERE word_id = {self.param_style}"
+        word = _word_cache.get(word_id)
+        if word is not None:
+            return word
+
+        word = self._fetch_word_by_id(word_id)
+        if word is not None:
+            self._cache_put(_word_cache, word_id, word)
+        return word
+
+    def get_words_by_ids(self, word_ids: Sequence[int]) -> List[CachedWord]:
+        """
+        Возвращает слова в порядке word_ids (несуществующие пропускаются).
+        Слова, которых нет в кэше, загружаются одним запросом.
+        """
+        found: Dict[int, CachedWord] = {}
+        missing: List[int] = []
+        for word_id in dict.fromkeys(word_ids):
+            word = _word_cache.get(word_id)
+            if word is not None:
+                found[word_id] = word
+            else:
+                missing.append(word_id)
+
+        if missing:
+            cursor = self.connection.cursor()
+            cursor.execute(_words_by_ids_sql(self.is_postgres, len(missing)), missing)
+            for row in cursor.fetchall():
+                word = self._word_from_relations_row(row)
+                self._cache_put(_word_cache, word.word_id, word)
+                found[word.word_id] = word
+
+        return [found[word_id] for word_id in word_ids if word_id in found]
+
+    def _fetch_word_by_id(self, word_id: int) -> Optional[CachedWord]:
         cursor = self.connection.cursor()
-        cursor.execute(query, (word_id,))
-        word_data = cursor.fetchone()
-        if not word_data:
+        cursor.execute(_WORD_WITH_RELATIONS_SQL[self.is_postgres], (word_id,))
+        row = cursor.fetchone()
+        if not row:
             return None
+        return self._word_from_relations_row(row)
+
+    def _word_from_relations_row(self, row: Dict[str, Any]) -> CachedWord:
+        """Собирает CachedWord из строки с JSON-массивами переводов и спряжений."""
+        word_data = dict(row)
+        translations = _load_json_array(word_data.pop("translations_json"))
+        conjugations = _load_json_array(word_data.pop("conjugations_json"))
+        word_id = word_data["word_id"]
 
         word = self._row_to_model(word_data, CachedWord)
-        if not word:
-            return None
-        word.translations = self.get_translations_for_word(word_id)
-        word.conjugations = self.get_conjugations_for_word(word_id)
+        # Элементы JSON-массивов - свежие dict, дополняем их без копий
+        for item in translations:
+            item["word_id"] = word_id
+        for item in conjugations:
+            item["word_id"] = word_id
+        word.translations = [
+            self._row_to_model(item, Translation) for item in translations
+        ]
+        word.conjugations = [
+            self._row_to_model(item, VerbConjugation) for item in conjugations
+        ]
         return word
 
     def get_translations_for_word(self, word_id: int) -> List[Translation]:
-        query = f"SELECT * FROM translations WHERE word_id = {self.param_style} ORDER BY is_primary DESC"
-        cursor = self.connection.cursor()
-        cursor.execute(query, (word_id,))
+        cursor = self._tuple_cursor()
+        cursor.execute(_SELECT_TRANSLATIONS_SQL[self.param_style], (word_id,))
         translations_data = cursor.fetchall()
-        return self._rows_to_models(translations_data, Translation)
+        return self._rows_to_models(
+            translations_data, Translation, _TRANSLATION_COLUMNS
+        )
 
     def get_conjugations_for_word(self, word_id: int) -> List[VerbConjugation]:
-        query = f"SELECT * FROM verb_conjugations WHERE word_id = {self.param_style} ORDER BY id"
-        cursor = self.connection.cursor()
-        cursor.execute(query, (word_id,))
+        cursor = self._tuple_cursor()
+        cursor.execute(_SELECT_CONJUGATIONS_SQL[self.param_style], (word_id,))
         conjugations_data = cursor.fetchall()
-        return self._rows_to_models(conjugations_data, VerbConjugation)
-
-    def get_random_verb_for_training(self, user_id: int) -> Optional[CachedWord]:
-        order_by_clause = "RANDOM()" if not self.is_postgres else "RANDOM()"
-        query = f"""
-            SELECT cw.*
-            FROM cached_words cw
-            JOIN user_dictionary ud ON cw.word_id = ud.word_id
-            WHERE ud.user_id = {self.param_style} AND cw.part_of_speech = 'verb'
-            ORDER BY {order_by_clause}
-            LIMIT 1
+        return self._rows_to_models(
+            conjugations_data, VerbConjugation, _CONJUGATION_COLUMNS
+        )
+
+    def count_user_verbs(self, user_id: int) -> int:
+        cursor = self._tuple_cursor()
+        cursor.execute(_COUNT_USER_VERBS_SQL[self.param_style], (user_id,))
+        row = cursor.fetchone()
+        return row[0] if row else 0
+
+    def get_random_verb_training_item(
+        self, user_id: int, active_tenses: Sequence[str]
+    ) -> Optional[Tuple[CachedWord, VerbConjugation]]:
         """
-        cursor = self.connection.cursor()
-        cursor.execute(query, (user_id,))
-        word_data = cursor.fetchone()
-        return self._row_to_model(word_data, CachedWord)
+        Случайный глагол пользователя и его случайная форма в активных временах.
+        Запросы отбирают только подходящие глаголы, поэтому повторные попытки
+        не нужны; сам глагол со спряжениями берется из кэша.
+        Вместо выборки всех ID считаем кандидатов и берем один по случайному
+        смещению: глагол выбирается равновероятно, затем время и форма.
+        """
+        if not active_tenses:
+            return None
+        tenses_count = len(active_tenses)
+        cursor = self._tuple_cursor()
+        cursor.execute(
+            _count_user_verbs_with_tenses_sql(self.param_style, tenses_count),
+            (user_id, *active_tenses),
+        )
+        verbs_count = cursor.fetchone()[0]
+        if not verbs_count:
+            return None
+
+        cursor.execute(
+            _user_verb_id_with_tenses_at_offset_sql(self.param_style, tenses_count),
+            (user_id, *active_tenses, random.randrange(verbs_count)),
+        )
+        row = cursor.fetchone()
+        # Глагол могли удалить из словаря между запросами
+        if row is None:
+            return None
+
+        word = self.get_word_by_id(row[0])
+        conjugation = self._pick_conjugation(word, active_tenses)
+        if conjugation is None:
+            return None
+        return word, conjugation
 
     def get_random_conjugation_for_word(
-        self, word_id: int, active_tenses: List[str]
+        self, word_id: int, active_tenses: Sequence[str]
     ) -> Optional[VerbConjugation]:
         if not active_tenses:
             return None
 
-        placeholders = ", ".join([self.param_style] * len(active_tenses))
-        order_by_clause = "RANDOM()" if not self.is_postgres else "RANDOM()"
-        query = f"""
-            SELECT * FROM verb_conjugations
-            WHERE word_id = {self.param_style} AND tense IN ({placeholders})
-            ORDER BY {order_by_clause} LIMIT 1
-        """
-        cursor = self.connection.cursor()
-        cursor.execute(query, (word_id, *active_tenses))
-        conjugation_data = cursor.fetchone()
-        return self._row_to_model(conjugation_data, VerbConjugation)
+        # Спряжения берем у слова из кэша (при промахе - один запрос, после
+        # которого слово тоже окажется в кэше).
+        return self._pick_conjugation(self.get_word_by_id(word_id), active_tenses)
+
+    @staticmethod
+    def _pick_conjugation(
+        word: Optional[CachedWord], active_tenses: Sequence[str]
+    ) -> Optional[VerbConjugation]:
+        # Сначала случайное время, затем случайная форма в нем; если у глагола
+        # нет форм этого времени, пробуем следующее.
+        if word is None or not word.conjugations:
+            return None
+
+        tenses = list(active_tenses)
+        random.shuffle(tenses)
+        for tense in tenses:
+            forms = [c for c in word.conjugations if c.tense == tense]
+            if forms:
+                return random.choice(forms)
+        return None
 
     def find_word_by_normalized_form(
         self, normalized_word: str, only_normalized_form: Optional[bool] = False
     ) -> Optional[CachedWord]:
-        cursor = self.connection.cursor()
-        word_id = None
+        """
+        Индексы: idx_cached_words_normalized_word,
+        idx_verb_conjugations_normalized_word (покрывают word_id).
+        """
+        cache_key = (normalized_word, bool(only_normalized_form))
+        cached_ids = _word_ids_by_form_cache.get(cache_key)
+        if cached_ids is not None:
+            return self.get_word_by_id(cached_ids[0])
 
-        word_query = f"SELECT word_id FROM cached_words WHERE normalized_hebrew = {self.param_style}"
-        cursor.execute(word_query, (normalized_word,))
-        word_data_row = cursor.fetchone()
-        if word_data_row:
-            word_id = word_data_row["word_id"]
+        cursor = self.connection.cursor()
+        cursor.execute(
+            _SELECT_WORD_ID_BY_NORMALIZED_SQL[self.param_style], (normalized_word,)
+        )
+        row = cursor.fetchone()
 
-        if word_id is None and not only_normalized_form:
-            conjugation_query = f"SELECT word_id FROM verb_conjugations WHERE normalized_hebrew_form = {self.param_style}"
-            cursor.execute(conjugation_query, (normalized_word,))
-            conjugation = cursor.fetchone()
-            if conjugation:
-                word_id = conjugation["word_id"]
+        # Совпадение по основной форме приоритетнее: спряжения ищем только
+        # при промахе, чтобы не выполнять второй запрос на каждый поиск
+        if row is None and not only_normalized_form:
+            cursor.execute(
+                _SELECT_WORD_ID_BY_CONJUGATION_SQL[self.param_style],
+                (normalized_word,),
+            )
+            row = cursor.fetchone()
+        word_id = row["word_id"] if row else None
 
         if not word_id:
             return None
 
+        self._cache_put(_word_ids_by_form_cache, cache_key, (word_id,))
         return self.get_word_by_id(word_id)
 
     def find_words_by_normalized_form(self, normalized_word: str) -> List[CachedWord]:
-        cursor = self.connection.cursor()
-        query = f"SELECT word_id FROM cached_words WHERE normalized_hebrew = {self.param_style}"
-        cursor.execute(query, (normalized_word,))
-        word_ids = [row["word_id"] for row in cursor.fetchall()]
-
-        conj_query = f"SELECT DISTINCT word_id FROM verb_conjugations WHERE normalized_hebrew_form = {self.param_style}"
-        cursor.execute(conj_query, (normalized_word,))
-        conj_word_ids = [row["word_id"] for row in cursor.fetchall()]
-
-        all_ids = list(set(word_ids + conj_word_ids))
-
-        if not all_ids:
-            return []
+        """
+        Индексы: idx_cached_words_normalized_word,
+        idx_verb_conjugations_normalized_word (покрывают word_id).
+        """
+        cached_ids = _word_ids_by_form_cache.get(normalized_word)
+        if cached_ids is not None:
+            return self.get_words_by_ids(cached_ids)
 
-        return [self.get_word_by_id(word_id) for word_id in all_ids if word_id]
+        # Все совпадения вместе с переводами и спряжениями одним запросом
+        cursor = self.connection.cursor()
+        cursor.execute(
+            _WORDS_WITH_RELATIONS_BY_FORM_SQL[self.is_postgres],
+            (normalized_word, normalized_word),
+        )
+        words = [self._word_from_relations_row(row) for row in cursor.fetchall()]
+        for word in words:
+            self._cache_put(_word_cache, word.word_id, word)
+        if words:
+            self._cache_put(
+                _word_ids_by_form_cache,
+                normalized_word,
+                tuple(word.word_id for word in words),
+            )
+        return words
 
     def get_word_hebrew_by_id(self, word_id: int) -> Optional[str]:
-        query = f"SELECT hebrew FROM cached_words WHERE word_id = {self.param_style}"
+        hebrew = _word_hebrew_cache.get(word_id)
+        if hebrew is not None:
+            return hebrew
+
         cursor = self.connection.cursor()
-        cursor.execute(query, (word_id,))
+        cursor.execute(_SELECT_WORD_HEBREW_SQL[self.param_style], (word_id,))
         result = cursor.fetchone()
-        return result["hebrew"] if result else None
+        if not result:
+            return None
+        hebrew = result["hebrew"]
+        self._cache_put(_word_hebrew_cache, word_id, hebrew)
+        return hebrew
 
     def get_random_grammatical_form(
-        self, word: CachedWord, active_tenses: List[str]
+        self, word: CachedWord, active_tenses: Sequence[str]
     ) -> Tuple[Optional[str], Optional[str]]:
         """Выбирает случайную грамматическую форму для слова в зависимости от части речи."""
         if word.part_of_speech == PartOfSpeech.NOUN:
@@ -184,141 +795,183 @@ class WordRepository(BaseRepository):
         return (None, None)
 
     def create_cached_word(self, word_data: CreateCachedWord) -> int:
+        return self.create_cached_words([word_data])[0]
+
+    def create_cached_words(self, words: Sequence[CreateCachedWord]) -> List[int]:
+        """
+        Сохраняет несколько слов в текущей транзакции.
+        Переводы и спряжения всех слов вставляются одним executemany на таблицу.
+        """
         cursor = self.connection.cursor()
+        word_ids: List[int] = []
+        translations_to_insert = []
+        conjugations_to_insert = []
 
-        word_db_data = word_data.model_dump(exclude={"translations", "conjugations"})
-        word_db_data["fetched_at"] = datetime.now()
+        for word_data in words:
+            word_db_data = word_data.model_dump(
+                exclude={"translations", "conjugations"}
+            )
 
-        columns = ", ".join(word_db_data.keys())
-        placeholders = ", ".join([self.param_style] * len(word_db_data))
-        word_query = f"INSERT INTO cached_words ({columns}) VALUES ({placeholders})"
+            word_query = _insert_word_sql(self.param_style, tuple(word_db_data))
+            cursor.execute(word_query, list(word_db_data.values()))
+            row = cursor.fetchone()
+            word_id = row["word_id"] if row else None
 
-        if self.is_postgres:
-            word_query += " RETURNING word_id"
+            if not word_id:
+                raise Exception("Failed to get last row id for new word.")
+            word_ids.append(word_id)
 
-        cursor.execute(word_query, list(word_db_data.values()))
+            if word_data.translations:
+                translations_to_insert.extend(
+                    (word_id, t.translation_text, t.context_comment, t.is_primary)
+                    for t in word_data.translations
+                )
 
-        if self.is_postgres:
-            word_id = cursor.fetchone()["word_id"]
-        else:
-            word_id = cursor.lastrowid
+            if hasattr(word_data, "conjugations") and word_data.conjugations:
+                conjugations_to_insert.extend(
+                    (
+                        word_id,
+                        c.tense.value,
+                        c.person.value,
+                        c.hebrew_form,
+                        c.normalized_hebrew_form,
+                        c.transcription,
+                    )
+                    for c in word_data.conjugations
+                )
 
-        if not word_id:
-            raise Exception("Failed to get last row id for new word.")
+        if translations_to_insert:
+            self._insert_many(cursor, _INSERT_TRANSLATION_SQL, translations_to_insert)
+        if conjugations_to_insert:
+            self._insert_many(cursor, _INSERT_CONJUGATION_SQL, conjugations_to_insert)
 
-        if word_data.translations:
-            translations_to_insert = [
-                (word_id, t.translation_text, t.context_comment, t.is_primary)
-                for t in word_data.translations
+        if word_ids:
+            _invalidate_cached_words(word_ids)
+        if word_ids and self.pending_cache_writes is not None:
+            # Отбрасываем только записи, устаревшие после вставки. Сброс
+            # повторяется после коммита: читатель на другом соединении мог
+            # между сбросом и коммитом вернуть в кэш результат без новых слов.
+            new_ids = set(word_ids)
+            self.pending_cache_writes[:] = [
+                cache_write
+                for cache_write in self.pending_cache_writes
+                if not _is_stale_after_insert(cache_write, new_ids)
             ]
-            trans_cols = "word_id, translation_text, context_comment, is_primary"
-            trans_placeholders = f"{self.param_style}, {self.param_style}, {self.param_style}, {self.param_style}"
-            translations_query = (
-                f"INSERT INTO translations ({trans_cols}) VALUES ({trans_placeholders})"
+            self.pending_cache_writes.append(
+                partial(_invalidate_cached_words, word_ids)
             )
-            cursor.executemany(translations_query, translations_to_insert)
-
-        if hasattr(word_data, "conjugations") and word_data.conjugations:
-            conjugations_to_insert = [
-                (
-                    word_id,
-                    c.tense.value,
-                    c.person.value,
-                    c.hebrew_form,
-                    c.normalized_hebrew_form,
-                    c.transcription,
-                )
-                for c in word_data.conjugations
-            ]
-            conj_cols = "word_id, tense, person, hebrew_form, normalized_hebrew_form, transcription"
-            conj_placeholders = f"{self.param_style}, {self.param_style}, {self.param_style}, {self.param_style}, {self.param_style}, {self.param_style}"
-            conjugations_query = f"INSERT INTO verb_conjugations ({conj_cols}) VALUES ({conj_placeholders})"
-            cursor.executemany(conjugations_query, conjugations_to_insert)
-
-        return word_id
+        return word_ids
 
 
 class UserDictionaryRepository(BaseRepository):
+    def __init__(
+        self,
+        connection: Connection,
+        is_postgres: bool = True,
+        pending_cache_writes: Optional[List[Callable[[], None]]] = None,
+    ):
+        super().__init__(connection, is_postgres, pending_cache_writes)
+        # Один репозиторий слов на соединение вместо нового на каждый вызов
+        self.word_repo = WordRepository(connection, is_postgres, pending_cache_writes)
+
     def add_user(self, user_id: int, first_name: str, username: Optional[str]):
-        if self.is_postgres:
-            query = f"INSERT INTO users (user_id, first_name, username) VALUES ({self.param_style}, {self.param_style}, {self.param_style}) ON CONFLICT (user_id) DO NOTHING"
-        else:
-            query = f"INSERT OR IGNORE INTO users (user_id, first_name, username) VALUES ({self.param_style}, {self.param_style}, {self.param_style})"
         cursor = self.connection.cursor()
-        cursor.execute(query, (user_id, first_name, username))
+        cursor.execute(
+            _INSERT_USER_SQL[self.is_postgres], (user_id, first_name, username)
+        )
 
     def add_word_to_dictionary(self, user_id: int, word_id: int):
-        if self.is_postgres:
-            query = f"INSERT INTO user_dictionary (user_id, word_id, next_review_at) VALUES ({self.param_style}, {self.param_style}, {self.param_style}) ON CONFLICT (user_id, word_id) DO NOTHING"
-        else:
-            query = f"INSERT OR IGNORE INTO user_dictionary (user_id, word_id, next_review_at) VALUES ({self.param_style}, {self.param_style}, {self.param_style})"
+        self.add_words_to_dictionary(user_id, [word_id])
+
+    def add_words_to_dictionary(self, user_id: int, word_ids: Sequence[int]):
+        """Добавляет несколько слов в словарь пользователя одним executemany."""
+        if not word_ids:
+            return
         cursor = self.connection.cursor()
-        cursor.execute(query, (user_id, word_id, datetime.now()))
+        cursor.executemany(
+            _INSERT_DICTIONARY_WORD_SQL[self.is_postgres],
+            [(user_id, word_id) for word_id in word_ids],
+        )
 
     def remove_word_from_dictionary(self, user_id: int, word_id: int):
-        query = f"DELETE FROM user_dictionary WHERE user_id = {self.param_style} AND word_id = {self.param_style}"
         cursor = self.connection.cursor()
-        cursor.execute(query, (user_id, word_id))
+        cursor.execute(
+            _DELETE_DICTIONARY_WORD_SQL[self.param_style], (user_id, word_id)
+        )
 
     def get_dictionary_page(
         self, user_id: int, page: int, page_size: int
     ) -> List[CachedWord]:
+        # word_id - детерминированный порядок для слов с одинаковым added_at
+        # (слова, добавленные в одной транзакции), иначе страницы "прыгают".
+        # Сортировка совпадает с индексом idx_user_dictionary_user_added.
         limit = page_size + 1
         offset = page * page_size
-        query = f"""
-            SELECT cw.*
-            FROM cached_words cw
-            JOIN user_dictionary ud ON cw.word_id = ud.word_id
-            WHERE ud.user_id = {self.param_style}
-            ORDER BY ud.added_at DESC
-            LIMIT {self.param_style} OFFSET {self.param_style}
-        """
         cursor = self.connection.cursor()
-        cursor.execute(query, (user_id, limit, offset))
+        cursor.execute(
+            _SELECT_DICTIONARY_PAGE_SQL[self.param_style], (user_id, limit, offset)
+        )
         word_data_rows = cursor.fetchall()
         words = self._rows_to_models(word_data_rows, CachedWord)
-        word_repo = WordRepository(self.connection, self.is_postgres)
-        for word in words:
-            word.translations = word_repo.get_translations_for_word(word.word_id)
+        self._attach_translations(words)
         return words
 
+    def count_dictionary_words(self, user_id: int) -> int:
+        cursor = self._tuple_cursor()
+        cursor.execute(_COUNT_DICTIONARY_WORDS_SQL[self.param_style], (user_id,))
+        row = cursor.fetchone()
+        return row[0] if row else 0
+
+    def _attach_translations(self, words: List[CachedWord]) -> None:
+        """Загружает переводы для всех слов страницы одним запросом (без N+1)."""
+        if not words:
+            return
+        word_ids = [word.word_id for word in words]
+        cursor = self._tuple_cursor()
+        cursor.execute(
+            _translations_by_word_ids_sql(self.param_style, len(word_ids)), word_ids
+        )
+        translations = self._rows_to_models(
+            cursor.fetchall(), Translation, _TRANSLATION_COLUMNS
+        )
+        grouped: Dict[int, List[Translation]] = defaultdict(list)
+        for translation in translations:
+            grouped[translation.word_id].append(translation)
+        for word in words:
+            word.translations = grouped.get(word.word_id, [])
+
     def is_word_in_dictionary(self, user_id: int, word_id: int) -> bool:
-        query = f"SELECT 1 FROM user_dictionary WHERE user_id = {self.param_style} AND word_id = {self.param_style}"
-        cursor = self.connection.cursor()
-        cursor.execute(query, (user_id, word_id))
-        result = cursor.fetchone()
-        return result is not None
+        return word_id in self.are_words_in_dictionary(user_id, [word_id])
+
+    def are_words_in_dictionary(
+        self, user_id: int, word_ids: Sequence[int]
+    ) -> Set[int]:
+        """Возвращает те из word_ids, что есть в словаре пользователя (один запрос)."""
+        if not word_ids:
+            return set()
+        cursor = self._tuple_cursor()
+        cursor.execute(
+            _dictionary_word_ids_sql(self.param_style, len(word_ids)),
+            (user_id, *word_ids),
+        )
+        return {row[0] for row in cursor.fetchall()}
 
     def get_user_words_for_training(self, user_id: int, limit: int) -> List[CachedWord]:
-        order_by_clause = "ud.next_review_at ASC"
-        query = f"""
-            SELECT cw.*
-            FROM cached_words cw
-            JOIN user_dictionary ud ON cw.word_id = ud.word_id
-            WHERE ud.user_id = {self.param_style}
-            ORDER BY {order_by_clause}
-            LIMIT {self.param_style}
-        """
+        """Индекс: idx_user_dictionary_user_next_review."""
         cursor = self.connection.cursor()
-        cursor.execute(query, (user_id, limit))
+        cursor.execute(_SELECT_TRAINING_WORDS_SQL[self.param_style], (user_id, limit))
         word_data_rows = cursor.fetchall()
         words = self._rows_to_models(word_data_rows, CachedWord)
-        word_repo = WordRepository(self.connection, self.is_postgres)
-        for word in words:
-            word.translations = word_repo.get_translations_for_word(word.word_id)
+        self._attach_translations(words)
         return words
 
     def get_ready_for_training_words_count(self, user_id: int) -> int:
         """
         Шаг 1 оптимизации: Считает количество слов, готовых к тренировке. [cite: 133-134]
-        """
-        now_func = "NOW()" if self.is_postgres else "CURRENT_TIMESTAMP"
-        query = f"""
-            SELECT COUNT(id) FROM user_dictionary
-            WHERE user_id = {self.param_style} AND next_review_at <= {now_func}
+        Индекс: idx_user_dictionary_user_next_review (запрос читает только его).
         """
         cursor = self.connection.cursor()
-        cursor.execute(query, (user_id,))
+        cursor.execute(_COUNT_READY_WORDS_SQL[self.param_style], (user_id,))
         result = cursor.fetchone()
         return result[0] if result else 0
 
@@ -327,18 +980,12 @@ class UserDictionaryRepository(BaseRepository):
     ) -> Optional[CachedWord]:
         """
         Шаг 2 оптимизации: Получает одно случайное слово для тренировки, используя offset. [cite: 137-139]
-        """
-        now_func = "NOW()" if self.is_postgres else "CURRENT_TIMESTAMP"
-        query = f"""
-            SELECT cw.*
-            FROM cached_words cw
-            JOIN user_dictionary ud ON cw.word_id = ud.word_id
-            WHERE ud.user_id = {self.param_style} AND ud.next_review_at <= {now_func}
-            ORDER BY ud.next_review_at ASC
-            LIMIT 1 OFFSET {self.param_style}
+        Индекс: idx_user_dictionary_user_next_review.
         """
         cursor = self.connection.cursor()
-        cursor.execute(query, (user_id, offset))
+        cursor.execute(
+            _SELECT_READY_WORD_AT_OFFSET_SQL[self.param_style], (user_id, offset)
+        )
         word_data_row = cursor.fetchone()
 
         if not word_data_row:
@@ -346,104 +993,69 @@ class UserDictionaryRepository(BaseRepository):
 
         # Дозагружаем связанные данные (переводы и т.д.)
         word_id = word_data_row["word_id"]
-        word_repo = WordRepository(self.connection, self.is_postgres)
-        return word_repo.get_word_by_id(word_id)
+        return self.word_repo.get_word_by_id(word_id)
 
     def get_srs_level(self, user_id: int, word_id: int) -> Optional[int]:
-        query = f"SELECT srs_level FROM user_dictionary WHERE user_id = {self.param_style} AND word_id = {self.param_style}"
         cursor = self.connection.cursor()
-        cursor.execute(query, (user_id, word_id))
+        cursor.execute(_SELECT_SRS_LEVEL_SQL[self.param_style], (user_id, word_id))
         result = cursor.fetchone()
         return result["srs_level"] if result else None
 
     def update_srs_level(
         self, srs_level: int, next_review_at: datetime, user_id: int, word_id: int
     ):
-        query = f"""
-            UPDATE user_dictionary
-            SET srs_level = {self.param_style}, next_review_at = {self.param_style}
-            WHERE user_id = {self.param_style} AND word_id = {self.param_style}
-        """
         cursor = self.connection.cursor()
-        cursor.execute(query, (srs_level, next_review_at, user_id, word_id))
+        cursor.execute(
+            _UPDATE_SRS_LEVEL_SQL[self.param_style],
+            (srs_level, next_review_at, user_id, word_id),
+        )
 
 
 class UserSettingsRepository(BaseRepository):
     def get_user_settings(self, user_id: int) -> UserSettings:
-        # 1. Получаем настройки времен
-        tense_query = f"SELECT tense, is_active FROM user_tense_settings WHERE user_id = {self.param_style}"
-        cursor = self.connection.cursor()
-        cursor.execute(tense_query, (user_id,))
-        tense_rows = cursor.fetchall()
-
-        tense_settings_list = (
-            [
-                UserTenseSetting(
-                    user_id=user_id,
-                    tense=row["tense"],
-                    is_active=bool(row["is_active"]),
-                )
-                for row in tense_rows
-            ]
-            if tense_rows
-            else None
-        )
+        # 1. Получаем настройки времен и режима тренировки одним запросом
+        cursor = self._tuple_cursor()
+        cursor.execute(_SELECT_USER_SETTINGS_SQL[self.param_style], (user_id, user_id))
 
-        # 2. Получаем настройки режима тренировки
-        training_mode_query = f"SELECT use_grammatical_forms FROM user_settings WHERE user_id = {self.param_style}"
-        cursor.execute(training_mode_query, (user_id,))
-        training_mode_row = cursor.fetchone()
-        use_grammatical_forms = (
-            bool(training_mode_row["use_grammatical_forms"])
-            if training_mode_row
-            else False
-        )
+        tense_settings_list = []
+        use_grammatical_forms = False
+        for tense, flag in cursor.fetchall():
+            if tense is None:
+                use_grammatical_forms = bool(flag)
+            else:
+                tense_settings_list.append(
+                    UserTenseSetting(user_id=user_id, tense=tense, is_active=bool(flag))
+                )
 
-        # 3. Собираем всё в одну модель
+        # 2. Собираем всё в одну модель
         return UserSettings(
             user_id=user_id,
-            tense_settings=tense_settings_list,
+            tense_settings=tense_settings_list or None,
             use_grammatical_forms=use_grammatical_forms,
         )
 
-    def initialize_tense_settings(self, user_id: int):
-        default_settings = [
-            (user_id, "perf", True),
-            (user_id, "ap", True),
-            (user_id, "impf", True),
-            (user_id, "imp", True),
+    def initialize_tense_settings(self, user_id: int) -> List[UserTenseSetting]:
+        """
+        Создает настройки времен по умолчанию. Возвращает только вставленные
+        строки: уже существующие настройки не перезаписываются.
+        """
+        cursor = self._tuple_cursor()
+        cursor.execute(_INIT_TENSE_SETTINGS_SQL[self.is_postgres], (user_id,))
+        return [
+            UserTenseSetting(user_id=user_id, tense=tense, is_active=bool(flag))
+            for tense, flag in cursor.fetchall()
         ]
-        if self.is_postgres:
-            query = f"INSERT INTO user_tense_settings (user_id, tense, is_active) VALUES ({self.param_style}, {self.param_style}, {self.param_style}) ON CONFLICT (user_id, tense) DO NOTHING"
-        else:
-            query = f"INSERT OR IGNORE INTO user_tense_settings (user_id, tense, is_active) VALUES ({self.param_style}, {self.param_style}, {self.param_style})"
-        cursor = self.connection.cursor()
-        cursor.executemany(query, default_settings)
 
     def initialize_user_settings(self, user_id: int):
         # Новый метод для инициализации записи в user_settings [cite: 161-162]
-        if self.is_postgres:
-            query = f"INSERT INTO user_settings (user_id, use_grammatical_forms) VALUES ({self.param_style}, FALSE) ON CONFLICT (user_id) DO NOTHING"
-        else:
-            query = f"INSERT OR IGNORE INTO user_settings (user_id, use_grammatical_forms) VALUES ({self.param_style}, 0)"
         cursor = self.connection.cursor()
-        cursor.execute(query, (user_id,))
+        cursor.execute(_INIT_USER_SETTINGS_SQL[self.is_postgres], (user_id,))
 
     def toggle_tense_setting(self, user_id: int, tense: Tense):
-        query = f"""
-            UPDATE user_tense_settings
-            SET is_active = NOT is_active
-            WHERE user_id = {self.param_style} AND tense = {self.param_style}
-        """
         cursor = self.connection.cursor()
-        cursor.execute(query, (user_id, tense.value))
+        cursor.execute(_TOGGLE_TENSE_SQL[self.param_style], (user_id, tense.value))
 
     def toggle_training_mode(self, user_id: int):
         # Новый метод для переключения режима тренировки [cite: 165-166]
-        query = f"""
-            UPDATE user_settings
-            SET use_grammatical_forms = NOT use_grammatical_forms
-            WHERE user_id = {self.param_style}
-        """
         cursor = self.connection.cursor()
-        cursor.execute(query, (user_id,))
+        cursor.execute(_TOGGLE_TRAINING_MODE_SQL[self.param_style], (user_id,))
@@ -3,7 +3,7 @@
 from __future__ import annotations
 import abc
 from types import TracebackType
-from typing import Optional, Type
+from typing import Callable, List, Optional, Type
 
 from config import logger
 from dal.repositories import (
@@ -43,14 +43,16 @@ class UnitOfWork(AbstractUnitOfWork):
         self.connection_manager = db_manager
         self.connection: Optional[Connection] = None
         self.is_postgres = self.connection_manager.is_postgres
+        # Записи в общие кэши репозиториев и их сбросы, ожидающие коммита
+        self.pending_cache_writes: List[Callable[[], None]] = []
 
     def __enter__(self) -> AbstractUnitOfWork:
-        self.connection = self.connection_manager.__enter__()
-        self.words = WordRepository(self.connection, self.is_postgres)
-        self.user_dictionary = UserDictionaryRepository(
-            self.connection, self.is_postgres
-        )
-        self.user_settings = UserSettingsRepository(self.connection, self.is_postgres)
+        self.connection = self.connection_manager.acquire()
+        self.pending_cache_writes.clear()
+        repo_args = (self.connection, self.is_postgres, self.pending_cache_writes)
+        self.words = WordRepository(*repo_args)
+        self.user_dictionary = UserDictionaryRepository(*repo_args)
+        self.user_settings = UserSettingsRepository(*repo_args)
         return super().__enter__()
 
     def __exit__(
@@ -59,19 +61,27 @@ class UnitOfWork(AbstractUnitOfWork):
         exc_value: Optional[BaseException],
         traceback: Optional[TracebackType],
     ):
-        if exc_type:
-            logger.warning(
-                "Exception occurred, rolling back transaction.", exc_info=True
-            )
-            self.rollback()
-        elif self.connection:
-            self.commit()
-        self.connection_manager.__exit__(exc_type, exc_value, traceback)
+        try:
+            if exc_type:
+                logger.warning(
+                    "Exception occurred, rolling back transaction.", exc_info=True
+                )
+                self.rollback()
+            elif self.connection:
+                self.commit()
+        finally:
+            if self.connection:
+                self.connection_manager.release(self.connection)
+                self.connection = None
 
     def commit(self):
         if self.connection:
             self.connection.commit()
+            for cache_write in self.pending_cache_writes:
+                cache_write()
+            self.pending_cache_writes.clear()
 
     def rollback(self):
+        self.pending_cache_writes.clear()
         if self.connection:
             self.connection.rollback()
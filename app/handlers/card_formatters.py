@@ -1,9 +1,14 @@
 # -*- coding: utf-8 -*-
 
-from typing import Protocol
+from typing import Dict, Optional, Protocol
 
 from config import BINYAN_MAP
-from dal.models import CachedWord, PartOfSpeech
+from dal.models import Binyan, CachedWord, PartOfSpeech
+
+# Отображаемые названия биньянов вычисляются один раз для всех значений
+_BINYAN_DISPLAY: Dict[Binyan, str] = {
+    binyan: BINYAN_MAP.get(binyan, binyan.value).capitalize() for binyan in Binyan
+}
 
 
 class CardFormattingStrategy(Protocol):
@@ -14,53 +19,53 @@ class CardFormattingStrategy(Protocol):
 
 class VerbCardFormatter:
     def format(self, word_data: CachedWord) -> str:
-        card_text = ""
+        parts = []
         if word_data.root:
-            card_text += f"\nКорень: {word_data.root}"
+            parts.append(f"\nКорень: {word_data.root}")
         if word_data.binyan:
-            display_binyan = BINYAN_MAP.get(
-                word_data.binyan.value, word_data.binyan.value
-            ).capitalize()
-            card_text += f"\nБиньян: {display_binyan}"
-        return card_text
+            parts.append(f"\nБиньян: {_BINYAN_DISPLAY[word_data.binyan]}")
+        return "".join(parts)
 
 
 class NounCardFormatter:
     def format(self, word_data: CachedWord) -> str:
-        card_text = ""
+        parts = []
         if word_data.gender:
             gender_display = (
                 "Мужской род" if word_data.gender == "masculine" else "Женский род"
             )
-            card_text += f"\nРод: {gender_display}"
+            parts.append(f"\nРод: {gender_display}")
         if word_data.singular_form:
-            card_text += f"\nЕд. число: {word_data.singular_form}"
+            parts.append(f"\nЕд. число: {word_data.singular_form}")
         if word_data.plural_form:
-            card_text += f"\nМн. число: {word_data.plural_form}"
-        return card_text
+            parts.append(f"\nМн. число: {word_data.plural_form}")
+        return "".join(parts)
 
 
 class AdjectiveCardFormatter:
     def format(self, word_data: CachedWord) -> str:
-        card_text = "\n*Формы:*"
+        parts = ["\n*Формы:*"]
         if word_data.masculine_singular:
-            card_text += f"\nм.р., ед.ч.: {word_data.masculine_singular}"
+            parts.append(f"\nм.р., ед.ч.: {word_data.masculine_singular}")
         if word_data.feminine_singular:
-            card_text += f"\nж.р., ед.ч.: {word_data.feminine_singular}"
+            parts.append(f"\nж.р., ед.ч.: {word_data.feminine_singular}")
         if word_data.masculine_plural:
-            card_text += f"\nм.р., мн.ч.: {word_data.masculine_plural}"
+            parts.append(f"\nм.р., мн.ч.: {word_data.masculine_plural}")
         if word_data.feminine_plural:
-            card_text += f"\nж.р., мн.ч.: {word_data.feminine_plural}"
-        return card_text
+            parts.append(f"\nж.р., мн.ч.: {word_data.feminine_plural}")
+        return "".join(parts)
+
+
+# Форматтеры не хранят состояния, поэтому создаются один раз на модуль.
+_FORMATTERS: Dict[PartOfSpeech, CardFormattingStrategy] = {
+    PartOfSpeech.VERB: VerbCardFormatter(),
+    PartOfSpeech.NOUN: NounCardFormatter(),
+    PartOfSpeech.ADJECTIVE: AdjectiveCardFormatter(),
+}
 
 
 def get_card_formatter(
     part_of_speech: PartOfSpeech,
-) -> CardFormattingStrategy:
+) -> Optional[CardFormattingStrategy]:
     """Factory to get card formatter based on part of speech."""
-    formatters = {
-        PartOfSpeech.VERB: VerbCardFormatter(),
-        PartOfSpeech.NOUN: NounCardFormatter(),
-        PartOfSpeech.ADJECTIVE: AdjectiveCardFormatter(),
-    }
-    return formatters.get(part_of_speech)
+    return _FORMATTERS.get(part_of_speech)
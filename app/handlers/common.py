@@ -1,10 +1,12 @@
 # -*- coding: utf-8 -*-
 
+import asyncio
 from typing import Optional
 
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import ContextTypes, ConversationHandler
 from telegram.constants import ParseMode
+from telegram.error import BadRequest
 
 from config import (
     logger,
@@ -22,23 +24,41 @@ from handlers.card_formatters import get_card_formatter
 from metrics import increment_callbacks_counter
 from utils import set_request_id
 
+# Клавиатуры не зависят от пользователя и неизменяемы, поэтому создаются
+# один раз при импорте и переиспользуются во всех обработчиках.
+MAIN_MENU_KEYBOARD = InlineKeyboardMarkup(
+    [
+        [InlineKeyboardButton("🧠 Мой словарь", callback_data=f"{CB_DICT_VIEW}:0")],
+        [InlineKeyboardButton("💪 Тренировка", callback_data=CB_TRAIN_MENU)],
+        [InlineKeyboardButton("⚙️ Настройки", callback_data=CB_SETTINGS_MENU)],
+    ]
+)
+BACK_TO_MAIN_MENU_KEYBOARD = InlineKeyboardMarkup(
+    [[InlineKeyboardButton("⬅️ В главное меню", callback_data="main_menu")]]
+)
+
+
+def _add_user(user_id: int, first_name: str, username: Optional[str]) -> None:
+    with UnitOfWork() as uow:
+        uow.user_dictionary.add_user(user_id, first_name, username)
+        uow.commit()
+
+
+def _is_word_in_dictionary(user_id: int, word_id: int) -> bool:
+    with UnitOfWork() as uow:
+        return uow.user_dictionary.is_word_in_dictionary(user_id, word_id)
+
 
 @set_request_id
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Обработчик команды /start."""
     user = update.effective_user
-    with UnitOfWork() as uow:
-        uow.user_dictionary.add_user(user.id, user.first_name, user.username)
-        uow.commit()
+    # Запросы к БД выполняются в потоке, чтобы не блокировать цикл событий
+    await asyncio.to_thread(_add_user, user.id, user.first_name, user.username)
 
-    keyboard = [
-        [InlineKeyboardButton("🧠 Мой словарь", callback_data=f"{CB_DICT_VIEW}:0")],
-        [InlineKeyboardButton("💪 Тренировка", callback_data=CB_TRAIN_MENU)],
-        [InlineKeyboardButton("⚙️ Настройки", callback_data=CB_SETTINGS_MENU)],
-    ]
     await update.message.reply_text(
         f"Привет, {user.first_name}! Отправь мне слово на иврите для поиска.",
-        reply_markup=InlineKeyboardMarkup(keyboard),
+        reply_markup=MAIN_MENU_KEYBOARD,
     )
 
 
@@ -48,14 +68,7 @@ async def main_menu(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Возвращает пользователя в главное меню."""
     query = update.callback_query
     await query.answer()
-    keyboard = [
-        [InlineKeyboardButton("🧠 Мой словарь", callback_data=f"{CB_DICT_VIEW}:0")],
-        [InlineKeyboardButton("💪 Тренировка", callback_data=CB_TRAIN_MENU)],
-        [InlineKeyboardButton("⚙️ Настройки", callback_data=CB_SETTINGS_MENU)],
-    ]
-    await query.edit_message_text(
-        "Главное меню:", reply_markup=InlineKeyboardMarkup(keyboard)
-    )
+    await query.edit_message_text("Главное меню:", reply_markup=MAIN_MENU_KEYBOARD)
 
 
 async def display_word_card(
@@ -80,35 +93,39 @@ async def display_word_card(
     word_id = word_data.word_id
 
     if in_dictionary is None:
-        with UnitOfWork() as uow:
-            in_dictionary = uow.user_dictionary.is_word_in_dictionary(user_id, word_id)
+        in_dictionary = await asyncio.to_thread(
+            _is_word_in_dictionary, user_id, word_id
+        )
 
-    translations = word_data.translations
-    primary_translation = next(
-        (t.translation_text for t in translations if t.is_primary),
-        "Перевод не найден",
-    )
-    other_translations = [t.translation_text for t in translations if not t.is_primary]
+    # Основной и дополнительные переводы за один проход по списку
+    primary_translation = None
+    other_translations = []
+    for translation in word_data.translations:
+        if not translation.is_primary:
+            other_translations.append(translation.translation_text)
+        elif primary_translation is None:
+            primary_translation = translation.translation_text
+    if primary_translation is None:
+        primary_translation = "Перевод не найден"
 
     translation_str = primary_translation
     if other_translations:
-        translation_str += f" (также: {', '.join(other_translations)})"
+        translation_str = f"{translation_str} (также: {', '.join(other_translations)})"
 
     card_text_header = (
         f"Слово *{word_data.hebrew}* уже в вашем словаре."
         if in_dictionary
         else f"Найдено: *{word_data.hebrew}*"
     )
-    card_text = (
-        f"{card_text_header} [{word_data.transcription}]\nПеревод: {translation_str}\n"
-    )
-
     # --- ИСПОЛЬЗОВАНИЕ СТРАТЕГИИ ФОРМАТИРОВАНИЯ ---
     formatter = get_card_formatter(word_data.part_of_speech)
-    if formatter:
-        card_text += formatter.format(word_data)
+    details = formatter.format(word_data) if formatter else ""
 
-    card_text = card_text.strip()
+    # Текст карточки собирается одной f-строкой, без промежуточных копий
+    card_text = (
+        f"{card_text_header} [{word_data.transcription}]\n"
+        f"Перевод: {translation_str}\n{details}"
+    ).strip()
     # --- КОНЕЦ НОВОЙ ЛОГИКИ ---
 
     keyboard_buttons = []
@@ -168,8 +185,10 @@ async def display_word_card(
                 reply_markup=reply_markup,
                 parse_mode=ParseMode.MARKDOWN,
             )
-    except Exception as e:
-        if "Message is not modified" in str(e):
+    except BadRequest as e:
+        # Повторная отрисовка той же карточки - частый и безвредный случай:
+        # проверяем тип исключения и его message без str(e)
+        if e.message.startswith("Message is not modified"):
             logger.warning(
                 "Попытка отредактировать сообщение без изменений. Игнорируется."
             )
@@ -177,6 +196,10 @@ async def display_word_card(
             logger.error(
                 f"Ошибка при отправке/редактировании карточки слова: {e}", exc_info=True
             )
+    except Exception as e:
+        logger.error(
+            f"Ошибка при отправке/редактировании карточки слова: {e}", exc_info=True
+        )
 
 
 @increment_callbacks_counter
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
-
-from typing import Optional
+import asyncio
+from typing import List, Optional, Tuple
 
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import ContextTypes
@@ -13,9 +13,50 @@ from config import (
     DICT_WORDS_PER_PAGE,
     logger,
 )
+from dal.models import CachedWord
 from dal.unit_of_work import UnitOfWork
+from handlers.common import BACK_TO_MAIN_MENU_KEYBOARD
 from metrics import increment_callbacks_counter
-from utils import set_request_id
+from utils import fire_and_forget, parse_callback_args, set_request_id
+
+
+# Синхронные блоки работы с БД: обработчики выполняют их через
+# asyncio.to_thread, чтобы запросы не блокировали цикл событий и другие чаты.
+def _load_dictionary_page(
+    user_id: int, page: int, deletion_mode: bool, exclude_word_id: Optional[int]
+) -> Tuple[List[CachedWord], int, bool]:
+    with UnitOfWork() as uow:
+        words = uow.user_dictionary.get_dictionary_page(
+            user_id, page, DICT_WORDS_PER_PAGE
+        )
+        # Если мы только что удалили слово, убираем его из списка
+        if exclude_word_id:
+            words = [w for w in words if w.word_id != exclude_word_id]
+
+        # Если страница пуста после удаления, сразу переходим на последнюю
+        # непустую страницу: один COUNT вместо перебора страниц по одной
+        if not words and page > 0:
+            words_count = uow.user_dictionary.count_dictionary_words(user_id)
+            last_page = max(words_count - 1, 0) // DICT_WORDS_PER_PAGE
+            logger.info(
+                f"Page {page} is empty after deletion, redirecting to page {last_page}."
+            )
+            page, deletion_mode = last_page, False
+            words = uow.user_dictionary.get_dictionary_page(
+                user_id, page, DICT_WORDS_PER_PAGE
+            )
+    return words, page, deletion_mode
+
+
+def _get_word_hebrew(word_id: int) -> Optional[str]:
+    with UnitOfWork() as uow:
+        return uow.words.get_word_hebrew_by_id(word_id)
+
+
+def _remove_word_from_dictionary(user_id: int, word_id: int) -> None:
+    with UnitOfWork() as uow:
+        uow.user_dictionary.remove_word_from_dictionary(user_id, word_id)
+        uow.commit()
 
 
 @increment_callbacks_counter
@@ -28,11 +69,10 @@ async def view_dictionary_page_handler(
     в режим удаления.
     """
     query = update.callback_query
-    await query.answer()
+    fire_and_forget(query.answer())
 
-    parts = query.data.split(":")
-    action = f"{parts[0]}:{parts[1]}"  # e.g., "dict:view"
-    page = int(parts[2])
+    action, _, page_str = query.data.rpartition(":")  # e.g., "dict:view"
+    page = int(page_str)
     # Определяем, был ли включен режим удаления
     deletion_mode = action == CB_DICT_DELETE_MODE
 
@@ -54,61 +94,40 @@ async def view_dictionary_page_logic(
     query = update.callback_query
     user_id = query.from_user.id
 
-    with UnitOfWork() as uow:
-        words_from_db = uow.user_dictionary.get_dictionary_page(
-            user_id, page, DICT_WORDS_PER_PAGE
-        )
-
-    # Если мы только что удалили слово, убираем его из списка
-    words = (
-        [w for w in words_from_db if w.word_id != exclude_word_id]
-        if exclude_word_id
-        else words_from_db
+    words, page, deletion_mode = await asyncio.to_thread(
+        _load_dictionary_page, user_id, page, deletion_mode, exclude_word_id
     )
 
     has_next_page = len(words) > DICT_WORDS_PER_PAGE
     words_on_page = words[:DICT_WORDS_PER_PAGE]
 
-    # Если страница пуста после удаления, переходим на предыдущую
-    if not words_on_page and page > 0:
-        logger.info(
-            f"Page {page} is empty after deletion, redirecting to page {page - 1}."
-        )
-        return await view_dictionary_page_logic(
-            update, context, page=page - 1, deletion_mode=False
-        )
-
     # Если слов нет совсем
     if not words_on_page and page == 0:
         await query.edit_message_text(
             "Ваш словарь пуст.",
-            reply_markup=InlineKeyboardMarkup(
-                [[InlineKeyboardButton("⬅️ В главное меню", callback_data="main_menu")]]
-            ),
+            reply_markup=BACK_TO_MAIN_MENU_KEYBOARD,
         )
         return
 
-    keyboard = []
-    message_text = f"Ваш словарь (стр. {page + 1}):\n\n"
+    # Формируем кнопки для удаления или список слов (переводы нужны только
+    # для списка)
     if deletion_mode:
         message_text = "Выберите слово для удаления:"
-
-    # Формируем список слов или кнопки для удаления
-    for word in words_on_page:
-        primary_translation = next(
-            (t.translation_text for t in word.translations if t.is_primary), ""
-        )
-        if deletion_mode:
-            keyboard.append(
-                [
-                    InlineKeyboardButton(
-                        f"🗑️ {word.hebrew}",
-                        callback_data=f"{CB_DICT_CONFIRM_DELETE}:{word.word_id}:{page}",
-                    )
-                ]
-            )
-        else:
-            message_text += f"• {word.hebrew} — {primary_translation}\n"
+        keyboard = [
+            [
+                InlineKeyboardButton(
+                    f"🗑️ {word.hebrew}",
+                    callback_data=f"{CB_DICT_CONFIRM_DELETE}:{word.word_id}:{page}",
+                )
+            ]
+            for word in words_on_page
+        ]
+    else:
+        keyboard = []
+        lines = [f"Ваш словарь (стр. {page + 1}):\n\n"]
+        for word in words_on_page:
+            lines.append(f"• {word.hebrew} — {word.primary_translation_text}\n")
+        message_text = "".join(lines)
 
     # Навигационные кнопки
     nav_buttons = []
@@ -156,11 +175,10 @@ async def view_dictionary_page_logic(
 async def confirm_delete_word(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Показывает подтверждение удаления слова."""
     query = update.callback_query
-    await query.answer()
+    fire_and_forget(query.answer())
 
-    _, _, word_id_str, page_str = query.data.split(":")
-    with UnitOfWork() as uow:
-        word_hebrew = uow.words.get_word_hebrew_by_id(int(word_id_str))
+    word_id_str, page_str = parse_callback_args(query.data, 2)
+    word_hebrew = await asyncio.to_thread(_get_word_hebrew, int(word_id_str))
 
     if not word_hebrew:
         await query.edit_message_text("Ошибка: слово не найдено.")
@@ -188,17 +206,15 @@ async def confirm_delete_word(update: Update, context: ContextTypes.DEFAULT_TYPE
 async def execute_delete_word(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Окончательно удаляет слово из словаря пользователя."""
     query = update.callback_query
-    await query.answer("Слово удалено")
+    fire_and_forget(query.answer("Слово удалено"))
 
-    _, _, word_id_str, page_str = query.data.split(":")
+    word_id_str, page_str = parse_callback_args(query.data, 2)
     word_id, page = int(word_id_str), int(page_str)
     user_id = query.from_user.id
 
     logger.info(f"User {{{user_id}}} is deleting word {{{word_id}}}.")
 
-    with UnitOfWork() as uow:
-        uow.user_dictionary.remove_word_from_dictionary(user_id, word_id)
-        uow.commit()
+    await asyncio.to_thread(_remove_word_from_dictionary, user_id, word_id)
 
     # Перерисовываем страницу словаря, исключая удаленное слово
     await view_dictionary_page_logic(
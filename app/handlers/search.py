@@ -1,5 +1,9 @@
 # -*- coding: utf-8 -*-
-import re
+import asyncio
+from functools import lru_cache
+from itertools import groupby
+from operator import attrgetter
+from typing import Iterator, List, Optional, Tuple
 
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import ContextTypes
@@ -15,11 +19,147 @@ from config import (
     logger,
 )
 from services.parser import fetch_and_cache_word_data
-from utils import normalize_hebrew, set_request_id
-from handlers.common import display_word_card
+from utils import (
+    fire_and_forget,
+    normalize_hebrew,
+    parse_callback_args,
+    parse_callback_int,
+    set_request_id,
+)
+from handlers.common import BACK_TO_MAIN_MENU_KEYBOARD, display_word_card
+from dal.models import CachedWord, Person, VerbConjugation
 from dal.unit_of_work import UnitOfWork
 from metrics import increment_callbacks_counter, increment_messages_counter
 
+# Таблица для str.translate, удаляющая буквы иврита и дефис. Во введенном
+# слове после перевода не должно остаться ничего; если остались только
+# пробельные символы (str.isspace совпадает с \s в re), слов несколько.
+_HEBREW_WORD_DELETE = dict.fromkeys([*range(0x0590, 0x0600), ord("-")])
+# Границы блока иврита для быстрой проверки первого символа
+_HEBREW_FIRST = "\u0590"
+_HEBREW_LAST = "\u05ff"
+
+# Времена в таблице спряжений выводятся в порядке TENSE_MAP; ранги и
+# заголовки считаются один раз
+_TENSE_ORDER = {tense: rank for rank, tense in enumerate(TENSE_MAP)}
+_TENSE_TITLES = {tense: title.capitalize() for tense, title in TENSE_MAP.items()}
+# Начало строки спряжения ("_лицо_: ") для каждого лица
+_PERSON_PREFIXES = {
+    person: f"_{PERSON_MAP.get(person, person.value)}_: " for person in Person
+}
+
+# Сообщения поиска во внешнем словаре; для неуспешных статусов текст
+# выбирается по статусу из fetch_and_cache_word_data
+_PEALIM_SEARCHING_MESSAGE = "🔎 Ищу слово во внешнем словаре..."
+_PEALIM_STATUS_MESSAGES = {
+    "not_found": "Слово '{query}' не найдено.",
+    "error": (
+        "Внешний сервис словаря временно недоступен. Попробуйте, пожалуйста, позже."
+    ),
+    "db_error": (
+        "Произошла внутренняя ошибка при сохранении слова. "
+        "Пожалуйста, попробуйте позже."
+    ),
+}
+
+# Ограничение Telegram на длину сообщения и длина обрезанного текста
+_MESSAGE_MAX_LENGTH = 4096
+_TRUNCATED_LENGTH = 4090
+
+
+# Синхронные блоки работы с БД: обработчики выполняют их через
+# asyncio.to_thread, чтобы запросы не блокировали цикл событий и другие чаты.
+def _find_words_by_normalized_form(normalized_text: str) -> List[CachedWord]:
+    with UnitOfWork() as uow:
+        return uow.words.find_words_by_normalized_form(normalized_text)
+
+
+def _get_word_for_card(user_id: int, word_id: int) -> Tuple[Optional[CachedWord], bool]:
+    # Слово и признак "в словаре" за один переход в поток и одно соединение,
+    # чтобы display_word_card не проверял словарь отдельно
+    with UnitOfWork() as uow:
+        word_data = uow.words.get_word_by_id(word_id)
+        if word_data is None:
+            return None, False
+        return word_data, uow.user_dictionary.is_word_in_dictionary(user_id, word_id)
+
+
+def _add_word_to_dictionary(user_id: int, word_id: int) -> Optional[CachedWord]:
+    with UnitOfWork() as uow:
+        uow.user_dictionary.add_word_to_dictionary(user_id, word_id)
+        uow.commit()
+        return uow.words.get_word_by_id(word_id)
+
+
+def _load_verb_conjugations(
+    word_id: int, user_id: int
+) -> Tuple[Optional[str], List[VerbConjugation], Tuple[str, ...]]:
+    with UnitOfWork() as uow:
+        # Слово вместе со спряжениями берется из кэша слов (при промахе - одним
+        # запросом); без спряжений настройки пользователя не нужны
+        word = uow.words.get_word_by_id(word_id)
+        if word is None or not word.conjugations:
+            return None, [], ()
+
+        user_settings = uow.user_settings.get_user_settings(user_id)
+        # Инициализация, если настроек нет
+        if not user_settings.tense_settings:
+            created = uow.user_settings.initialize_tense_settings(user_id)
+            uow.commit()
+            # Пустой RETURNING: настройки параллельно создал другой запрос
+            user_settings = (
+                user_settings.with_tense_settings(created)
+                if created
+                else uow.user_settings.get_user_settings(user_id)
+            )
+
+        return word.hebrew, word.conjugations, user_settings.get_active_tenses()
+
+
+@lru_cache(maxsize=1024)
+def _verb_conjugations_keyboard(
+    word_id: int, with_show_all: bool
+) -> InlineKeyboardMarkup:
+    """
+    Клавиатура таблицы спряжений. Разметка неизменяема, поэтому готовые
+    объекты для недавно открытых глаголов переиспользуются.
+    """
+    keyboard = [
+        [
+            InlineKeyboardButton(
+                "⬅️ Назад к слову", callback_data=f"{CB_VIEW_CARD}:{word_id}"
+            )
+        ]
+    ]
+    if with_show_all:
+        keyboard.insert(
+            0,
+            [
+                InlineKeyboardButton(
+                    "👁️ Показать остальные времена",
+                    callback_data=f"{CB_SHOW_ALL_VERB_FORMS}:{word_id}",
+                )
+            ],
+        )
+    return InlineKeyboardMarkup(keyboard)
+
+
+def _conjugation_lines(conjugations: List[VerbConjugation]) -> Iterator[str]:
+    """Строки таблицы спряжений, сгруппированные по времени в порядке TENSE_MAP."""
+    # Устойчивая сортировка по рангу времени сохраняет порядок форм внутри
+    # времени, groupby собирает группы
+    conjugations_sorted = sorted(
+        conjugations, key=lambda c: _TENSE_ORDER.get(c.tense, len(_TENSE_ORDER))
+    )
+    for tense, conj_group in groupby(conjugations_sorted, key=attrgetter("tense")):
+        tense_display = _TENSE_TITLES.get(tense) or tense.value.capitalize()
+        yield f"\n*{tense_display}*:\n"
+        for conj in conj_group:
+            yield (
+                f"{_PERSON_PREFIXES[conj.person]}{conj.hebrew_form}"
+                f" ({conj.transcription})\n"
+            )
+
 
 @increment_messages_counter
 @set_request_id
@@ -34,12 +174,19 @@ async def handle_text_message(update: Update, context: ContextTypes.DEFAULT_TYPE
     user_id = update.effective_user.id
     chat_id = update.effective_chat.id
 
-    if not re.match(r"^[\u0590-\u05FF\s-]+$", text):
+    # Быстрый отказ: если первый символ не из блока иврита и не дефис,
+    # остальной текст можно не просматривать. Иначе один проход translate
+    # проверяет и набор символов, и количество слов.
+    first_char = text[:1]
+    starts_hebrew = _HEBREW_FIRST <= first_char <= _HEBREW_LAST or first_char == "-"
+    leftover = text.translate(_HEBREW_WORD_DELETE) if starts_hebrew else ""
+    if not starts_hebrew or (leftover and not leftover.isspace()):
         await update.message.reply_text(
             "Пожалуйста, используйте только буквы иврита, пробелы и дефисы."
         )
         return
-    if len(text.split()) > 1:
+    # text уже без пробелов по краям: оставшийся пробел - больше одного слова
+    if leftover:
         await update.message.reply_text(
             "Пожалуйста, отправляйте только по одному слову за раз."
         )
@@ -47,9 +194,9 @@ async def handle_text_message(update: Update, context: ContextTypes.DEFAULT_TYPE
 
     normalized_text = normalize_hebrew(text)
 
-    with UnitOfWork() as uow:
-        # Используем новый метод, возвращающий список
-        found_words = uow.words.find_words_by_normalized_form(normalized_text)
+    found_words = await asyncio.to_thread(
+        _find_words_by_normalized_form, normalized_text
+    )
 
     # Случай 1.1: Нет совпадений в локальной БД
     if not found_words:
@@ -80,10 +227,7 @@ async def handle_text_message(update: Update, context: ContextTypes.DEFAULT_TYPE
         message_text = "Найдено несколько вариантов. Выберите нужный:"
         keyboard = []
         for word in found_words:
-            primary_translation = next(
-                (t.translation_text for t in word.translations if t.is_primary), ""
-            )
-            button_text = f"{word.hebrew} - {primary_translation}"
+            button_text = f"{word.hebrew} - {word.primary_translation_text}"
             # Используем новую константу для callback
             keyboard.append(
                 [
@@ -118,9 +262,7 @@ async def search_in_pealim(
 
     # Проверяем, было ли сообщение от пользователя или это callback
     if update.message:
-        status_message = await update.message.reply_text(
-            "🔎 Ищу слово во внешнем словаре..."
-        )
+        status_message = await update.message.reply_text(_PEALIM_SEARCHING_MESSAGE)
         message_id = status_message.message_id
     else:  # Если это callback_query
         await update.callback_query.answer()
@@ -128,7 +270,7 @@ async def search_in_pealim(
         await context.bot.edit_message_text(
             chat_id=chat_id,
             message_id=update.callback_query.message.message_id,
-            text="🔎 Ищу слово во внешнем словаре...",
+            text=_PEALIM_SEARCHING_MESSAGE,
         )
         message_id = update.callback_query.message.message_id
 
@@ -145,8 +287,7 @@ async def search_in_pealim(
             )
             keyboard = []
             for word in data_list:
-                primary_translation = word.translations[0].translation_text
-                button_text = f"{word.hebrew} - {primary_translation}"
+                button_text = f"{word.hebrew} - {word.primary_translation_text}"
                 keyboard.append(
                     [
                         InlineKeyboardButton(
@@ -163,21 +304,9 @@ async def search_in_pealim(
                 text=message_text,
                 reply_markup=InlineKeyboardMarkup(keyboard),
             )
-    elif status == "not_found":
+    elif status in _PEALIM_STATUS_MESSAGES:
         await context.bot.edit_message_text(
-            f"Слово '{query}' не найдено.",
-            chat_id=chat_id,
-            message_id=message_id,
-        )
-    elif status == "error":
-        await context.bot.edit_message_text(
-            "Внешний сервис словаря временно недоступен. Попробуйте, пожалуйста, позже.",
-            chat_id=chat_id,
-            message_id=message_id,
-        )
-    elif status == "db_error":
-        await context.bot.edit_message_text(
-            "Произошла внутренняя ошибка при сохранении слова. Пожалуйста, попробуйте позже.",
+            _PEALIM_STATUS_MESSAGES[status].format(query=query),
             chat_id=chat_id,
             message_id=message_id,
         )
@@ -187,8 +316,7 @@ async def search_in_pealim(
 @set_request_id
 async def pealim_search_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Обработчик кнопки 'Искать еще в Pealim'."""
-    query_data = update.callback_query.data.split(":")
-    search_query = query_data[2]
+    (search_query,) = parse_callback_args(update.callback_query.data, 1)
     await search_in_pealim(update, context, search_query)
 
 
@@ -197,9 +325,9 @@ async def pealim_search_handler(update: Update, context: ContextTypes.DEFAULT_TY
 async def select_word_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Обработчик выбора одного из нескольких найденных слов."""
     query = update.callback_query
-    await query.answer()
+    fire_and_forget(query.answer())
 
-    _, _, word_id_str, search_query = query.data.split(":")
+    word_id_str, search_query = parse_callback_args(query.data, 2)
     word_id = int(word_id_str)
 
     logger.info(
@@ -209,8 +337,9 @@ async def select_word_handler(update: Update, context: ContextTypes.DEFAULT_TYPE
     user_id = query.from_user.id
     chat_id = query.message.chat_id
 
-    with UnitOfWork() as uow:
-        word_data = uow.words.get_word_by_id(word_id)
+    word_data, in_dictionary = await asyncio.to_thread(
+        _get_word_for_card, user_id, word_id
+    )
 
     if word_data:
         await display_word_card(
@@ -219,6 +348,7 @@ async def select_word_handler(update: Update, context: ContextTypes.DEFAULT_TYPE
             chat_id,
             word_data,
             message_id=query.message.message_id,
+            in_dictionary=in_dictionary,
             show_pealim_search_button=True,  # Также показываем кнопку
             search_query=search_query,
         )
@@ -232,15 +362,12 @@ async def select_word_handler(update: Update, context: ContextTypes.DEFAULT_TYPE
 async def add_word_to_dictionary(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Обработчик нажатия кнопки 'Добавить'."""
     query = update.callback_query
-    await query.answer("Добавлено!")
+    fire_and_forget(query.answer("Добавлено!"))
 
-    word_id = int(query.data.split(":")[2])
+    word_id = parse_callback_int(query.data)
     user_id = query.from_user.id
 
-    with UnitOfWork() as uow:
-        uow.user_dictionary.add_word_to_dictionary(user_id, word_id)
-        uow.commit()
-        word_data = uow.words.get_word_by_id(word_id)
+    word_data = await asyncio.to_thread(_add_word_to_dictionary, user_id, word_id)
 
     if word_data:
         word_dict = word_data
@@ -261,36 +388,19 @@ async def show_verb_conjugations(
 ):
     """Показывает таблицу спряжений для глагола с учетом настроек пользователя."""
     query = update.callback_query
-    await query.answer()
+    fire_and_forget(query.answer())
 
-    word_id = int(query.data.split(":")[-1])
+    word_id = parse_callback_int(query.data)
     user_id = query.from_user.id
 
-    with UnitOfWork() as uow:
-        word_hebrew = uow.words.get_word_hebrew_by_id(word_id)
-        all_conjugations = uow.words.get_conjugations_for_word(word_id)
-
-        user_settings = uow.user_settings.get_user_settings(user_id)
-        # Инициализация, если настроек нет
-        if not user_settings.tense_settings:
-            uow.user_settings.initialize_tense_settings(user_id)
-            uow.commit()
-            user_settings = uow.user_settings.get_user_settings(user_id)
-
-        active_tenses = user_settings.get_active_tenses()
-
-    keyboard = [
-        [
-            InlineKeyboardButton(
-                "⬅️ Назад к слову", callback_data=f"{CB_VIEW_CARD}:{word_id}"
-            )
-        ]
-    ]
+    word_hebrew, all_conjugations, active_tenses = await asyncio.to_thread(
+        _load_verb_conjugations, word_id, user_id
+    )
 
     if not all_conjugations or not word_hebrew:
         await query.edit_message_text(
             "Для этого глагола нет таблицы спряжений.",
-            reply_markup=InlineKeyboardMarkup(keyboard),
+            reply_markup=_verb_conjugations_keyboard(word_id, False),
         )
         return
 
@@ -309,44 +419,27 @@ async def show_verb_conjugations(
     if not conjugations_to_display and not show_all:
         message_text = "Все времена скрыты. Включите их в разделе 'Настройки', чтобы увидеть спряжения по умолчанию."
     else:
-        # Группируем по времени
-        conjugations_by_tense = {}
-        for conj in conjugations_to_display:
-            tense_val = conj.tense.value
-            if tense_val not in conjugations_by_tense:
-                conjugations_by_tense[tense_val] = []
-            conjugations_by_tense[tense_val].append(conj)
-
-        for tense, conj_list in sorted(
-            conjugations_by_tense.items(),
-            key=lambda item: list(TENSE_MAP.keys()).index(item[0]),
-        ):
-            tense_display = TENSE_MAP.get(tense, tense)
-            message_text += f"\n*{tense_display.capitalize()}*:\n"
-            for conj in conj_list:
-                person_display = PERSON_MAP.get(conj.person.value, conj.person.value)
-                message_text += (
-                    f"_{person_display}_: {conj.hebrew_form} ({conj.transcription})\n"
-                )
-
-    # Добавляем кнопку "Показать остальные", если нужно
-    if not show_all and hidden_conjugations:
-        keyboard.insert(
-            0,
-            [
-                InlineKeyboardButton(
-                    "👁️ Показать остальные времена",
-                    callback_data=f"{CB_SHOW_ALL_VERB_FORMS}:{word_id}",
-                )
-            ],
-        )
-
-    if len(message_text) > 4096:
-        message_text = message_text[:4090] + "\n(...)"
+        # Строки собираются, пока текст помещается в сообщение: длинную
+        # таблицу не нужно формировать целиком ради последующей обрезки
+        parts = [message_text]
+        total_length = len(message_text)
+        truncated = False
+        for line in _conjugation_lines(conjugations_to_display):
+            parts.append(line)
+            total_length += len(line)
+            if total_length > _MESSAGE_MAX_LENGTH:
+                truncated = True
+                break
+        message_text = "".join(parts)
+        if truncated:
+            message_text = message_text[:_TRUNCATED_LENGTH] + "\n(...)"
+
+    # Кнопка "Показать остальные" нужна, только если есть скрытые времена
+    with_show_all = not show_all and bool(hidden_conjugations)
 
     await query.edit_message_text(
         message_text,
-        reply_markup=InlineKeyboardMarkup(keyboard),
+        reply_markup=_verb_conjugations_keyboard(word_id, with_show_all),
         parse_mode=ParseMode.MARKDOWN,
     )
 
@@ -365,25 +458,28 @@ async def show_all_verb_forms_handler(
 async def view_word_card_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Обработчик для возврата к карточке слова (например, со страницы спряжений)."""
     query = update.callback_query
-    await query.answer()
+    fire_and_forget(query.answer())
 
-    word_id = int(query.data.split(":")[-1])
+    word_id = parse_callback_int(query.data)
     user_id = query.from_user.id
     chat_id = query.message.chat_id
     message_id = query.message.message_id
 
-    with UnitOfWork() as uow:
-        word_data = uow.words.get_word_by_id(word_id)
+    word_data, in_dictionary = await asyncio.to_thread(
+        _get_word_for_card, user_id, word_id
+    )
 
     if word_data:
-        word_dict = word_data
         await display_word_card(
-            context, user_id, chat_id, word_data=word_dict, message_id=message_id
+            context,
+            user_id,
+            chat_id,
+            word_data=word_data,
+            message_id=message_id,
+            in_dictionary=in_dictionary,
         )
     else:
         await query.edit_message_text(
             "Ошибка: слово не найдено.",
-            reply_markup=InlineKeyboardMarkup(
-                [[InlineKeyboardButton("⬅️ В главное меню", callback_data="main_menu")]]
-            ),
+            reply_markup=BACK_TO_MAIN_MENU_KEYBOARD,
         )
@@ -1,4 +1,6 @@
 # -*- coding: utf-8 -*-
+import asyncio
+from typing import Dict
 
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import ContextTypes
@@ -13,40 +15,111 @@ from config import (
     logger,
 )
 from dal.unit_of_work import UnitOfWork
-from dal.models import Tense
+from dal.models import Tense, UserSettings
 from metrics import increment_callbacks_counter
-from utils import set_request_id
+from utils import fire_and_forget, parse_callback_args, set_request_id
 
 
-@increment_callbacks_counter
-@set_request_id
-async def settings_menu(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    """Отображает главное меню настроек."""
-    query = update.callback_query
-    await query.answer()
-    user_id = query.from_user.id
+def _settings_menu_keyboard(use_grammatical_forms: bool) -> InlineKeyboardMarkup:
+    mode_status = "✅ Вкл" if use_grammatical_forms else "⬜️ Выкл"
+    training_mode_button_text = f"🔄 Продвинутый режим: {mode_status}"
+    return InlineKeyboardMarkup(
+        [
+            [
+                InlineKeyboardButton(
+                    "🕰️ Мои времена глаголов", callback_data=CB_TENSES_MENU
+                )
+            ],
+            [
+                InlineKeyboardButton(
+                    training_mode_button_text, callback_data=CB_TOGGLE_TRAINING_MODE
+                )
+            ],
+            [InlineKeyboardButton("⬅️ В главное меню", callback_data="main_menu")],
+        ]
+    )
 
-    # Получаем актуальные настройки пользователя
+
+# Меню настроек отличается только статусом режима: обе клавиатуры
+# собираются один раз при импорте модуля
+_SETTINGS_MENU_KEYBOARDS = {
+    use_grammatical_forms: _settings_menu_keyboard(use_grammatical_forms)
+    for use_grammatical_forms in (False, True)
+}
+
+
+def _tense_buttons(tense_key: str) -> Dict[bool, InlineKeyboardButton]:
+    tense_name = TENSE_MAP.get(tense_key, tense_key).capitalize()
+    callback_data = f"{CB_TENSE_TOGGLE}:{tense_key}"
+    return {
+        is_active: InlineKeyboardButton(
+            f"{'✅' if is_active else '⬜️'} {tense_name}", callback_data=callback_data
+        )
+        for is_active in (False, True)
+    }
+
+
+# Кнопки времен в нужном порядке, в обоих состояниях: при отрисовке меню
+# кнопки только выбираются, а не создаются заново
+_TENSE_BUTTONS = {
+    tense_key: _tense_buttons(tense_key) for tense_key in ("perf", "ap", "impf", "imp")
+}
+_TENSES_MENU_BACK_ROW = [
+    InlineKeyboardButton("⬅️ Назад", callback_data=CB_SETTINGS_MENU)
+]
+
+
+# Синхронные блоки работы с БД: обработчики выполняют их через
+# asyncio.to_thread, чтобы запросы не блокировали цикл событий и другие чаты.
+def _load_settings_for_menu(user_id: int) -> UserSettings:
     with UnitOfWork() as uow:
-        # Проверяем и при необходимости создаем записи в обеих таблицах настроек
-        uow.user_settings.initialize_tense_settings(user_id)
+        # Запись user_settings нужна для переключения режима. Недостающие
+        # времена (например, после добавления нового Tense) досоздаются при
+        # каждом открытии меню: INSERT ... ON CONFLICT DO NOTHING идемпотентен
         uow.user_settings.initialize_user_settings(user_id)
+        uow.user_settings.initialize_tense_settings(user_id)
         uow.commit()
+        return uow.user_settings.get_user_settings(user_id)
+
 
+def _load_tense_settings(user_id: int) -> UserSettings:
+    with UnitOfWork() as uow:
+        # Инициализация настроек, если они отсутствуют: вставленные строки
+        # возвращаются сразу, перечитываем только при гонке с другим запросом
         user_settings = uow.user_settings.get_user_settings(user_id)
+        if not user_settings.tense_settings:
+            created = uow.user_settings.initialize_tense_settings(user_id)
+            uow.commit()
+            # Пустой RETURNING: настройки параллельно создал другой запрос
+            user_settings = (
+                user_settings.with_tense_settings(created)
+                if created
+                else uow.user_settings.get_user_settings(user_id)
+            )
+        return user_settings
 
-    mode_status = "✅ Вкл" if user_settings.use_grammatical_forms else "⬜️ Выкл"
-    training_mode_button_text = f"🔄 Продвинутый режим: {mode_status}"
 
-    keyboard = [
-        [InlineKeyboardButton("🕰️ Мои времена глаголов", callback_data=CB_TENSES_MENU)],
-        [
-            InlineKeyboardButton(
-                training_mode_button_text, callback_data=CB_TOGGLE_TRAINING_MODE
-            )
-        ],
-        [InlineKeyboardButton("⬅️ В главное меню", callback_data="main_menu")],
-    ]
+def _toggle_tense_setting(user_id: int, tense: Tense) -> None:
+    with UnitOfWork() as uow:
+        uow.user_settings.toggle_tense_setting(user_id, tense)
+
+
+def _toggle_training_mode(user_id: int) -> None:
+    with UnitOfWork() as uow:
+        uow.user_settings.toggle_training_mode(user_id)
+        uow.commit()
+
+
+@increment_callbacks_counter
+@set_request_id
+async def settings_menu(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Отображает главное меню настроек."""
+    query = update.callback_query
+    fire_and_forget(query.answer())
+    user_id = query.from_user.id
+
+    # Получаем актуальные настройки пользователя
+    user_settings = await asyncio.to_thread(_load_settings_for_menu, user_id)
 
     message_text = (
         "⚙️ *Настройки*\n\n"
@@ -57,7 +130,7 @@ async def settings_menu(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     await query.edit_message_text(
         text=message_text,
-        reply_markup=InlineKeyboardMarkup(keyboard),
+        reply_markup=_SETTINGS_MENU_KEYBOARDS[user_settings.use_grammatical_forms],
         parse_mode=ParseMode.MARKDOWN,
     )
 
@@ -67,39 +140,19 @@ async def settings_menu(update: Update, context: ContextTypes.DEFAULT_TYPE):
 async def manage_tenses_menu(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Отображает меню управления временами глаголов."""
     query = update.callback_query
-    await query.answer()
+    fire_and_forget(query.answer())
     user_id = query.from_user.id
 
-    with UnitOfWork() as uow:
-        # Инициализация настроек, если они отсутствуют
-        user_settings = uow.user_settings.get_user_settings(user_id)
-        if not user_settings.tense_settings:
-            uow.user_settings.initialize_tense_settings(user_id)
-            uow.commit()
-
-        user_settings = uow.user_settings.get_user_settings(user_id)
-
-    keyboard = []
-    # Определяем нужный порядок времен
-    tense_keys_ordered = ["perf", "ap", "impf", "imp"]
+    user_settings = await asyncio.to_thread(_load_tense_settings, user_id)
 
     # Создаем словарь из Pydantic моделей для быстрого доступа
     settings_map = user_settings.get_settings_as_dict()
 
-    for tense_key in tense_keys_ordered:
-        tense_name = TENSE_MAP.get(tense_key, tense_key)  # Используем TENSE_MAP
-        is_active = settings_map.get(tense_key, False)
-        status_icon = "✅" if is_active else "⬜️"
-        button_text = f"{status_icon} {tense_name.capitalize()}"
-        keyboard.append(
-            [
-                InlineKeyboardButton(
-                    button_text, callback_data=f"{CB_TENSE_TOGGLE}:{tense_key}"
-                )
-            ]
-        )
-
-    keyboard.append([InlineKeyboardButton("⬅️ Назад", callback_data=CB_SETTINGS_MENU)])
+    keyboard = [
+        [buttons[settings_map.get(tense_key, False)]]
+        for tense_key, buttons in _TENSE_BUTTONS.items()
+    ]
+    keyboard.append(_TENSES_MENU_BACK_ROW)
 
     await query.edit_message_text(
         text="Выберите времена, которые вы хотите изучать и видеть в таблицах спряжений:",
@@ -113,10 +166,9 @@ async def toggle_tense(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Обрабатывает переключение статуса времени."""
     query = update.callback_query
     user_id = query.from_user.id
-    tense_to_toggle = query.data.split(":")[2]
+    (tense_to_toggle,) = parse_callback_args(query.data, 1)
 
-    with UnitOfWork() as uow:
-        uow.user_settings.toggle_tense_setting(user_id, Tense(tense_to_toggle))
+    await asyncio.to_thread(_toggle_tense_setting, user_id, Tense(tense_to_toggle))
 
     logger.info(f"User {{user_id}} toggled tense '{tense_to_toggle}'.")
 
@@ -131,12 +183,10 @@ async def toggle_training_mode_handler(
 ):
     """Обрабатывает переключение режима тренировки грамматических форм."""
     query = update.callback_query
-    await query.answer()
+    fire_and_forget(query.answer())
     user_id = query.from_user.id
 
-    with UnitOfWork() as uow:
-        uow.user_settings.toggle_training_mode(user_id)
-        uow.commit()
+    await asyncio.to_thread(_toggle_training_mode, user_id)
 
     # После изменения настройки, просто вызываем `settings_menu`,
     # чтобы перерисовать меню с актуальными данными.
@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
-
+import asyncio
 from datetime import datetime, timedelta
 import random
+from typing import Any, Dict, List, Optional, Tuple
+
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import ContextTypes
 from telegram.constants import ParseMode
@@ -22,24 +24,17 @@ from config import (
     CB_EVAL_INCORRECT,
     CB_END_TRAINING,
     CB_SETTINGS_MENU,
-    VERB_TRAINER_RETRY_ATTEMPTS,
     PERSON_MAP,
     TENSE_MAP,
 )
+from dal.models import CachedWord, VerbConjugation
 from dal.unit_of_work import UnitOfWork
 from utils import normalize_hebrew, set_request_id
 from metrics import increment_callbacks_counter, increment_messages_counter
 
-# --- Вход в меню тренировок ---
-
-
-@increment_callbacks_counter
-@set_request_id
-async def training_menu(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
-    """Отображает меню выбора режима тренировки."""
-    query = update.callback_query
-
-    keyboard = [
+# Неизменяемые клавиатуры собираются один раз при импорте модуля
+_TRAINING_MENU_KEYBOARD = InlineKeyboardMarkup(
+    [
         [
             InlineKeyboardButton(
                 "🇮🇱 → 🇷🇺 (Иврит → Русский)", callback_data=CB_TRAIN_HE_RU
@@ -57,37 +52,39 @@ async def training_menu(update: Update, context: ContextTypes.DEFAULT_TYPE) -> i
         ],
         [InlineKeyboardButton("⬅️ В главное меню", callback_data="main_menu")],
     ]
+)
+_BACK_TO_TRAINING_MENU_KEYBOARD = InlineKeyboardMarkup(
+    [[InlineKeyboardButton("⬅️ Назад", callback_data=CB_TRAIN_MENU)]]
+)
+_FLASHCARD_QUESTION_KEYBOARD = InlineKeyboardMarkup(
+    [
+        [InlineKeyboardButton("💡 Показать ответ", callback_data=CB_SHOW_ANSWER)],
+        [InlineKeyboardButton("❌ Закончить", callback_data=CB_END_TRAINING)],
+    ]
+)
+_FLASHCARD_EVAL_KEYBOARD = InlineKeyboardMarkup(
+    [
+        [InlineKeyboardButton("✅ Знаю", callback_data=CB_EVAL_CORRECT)],
+        [InlineKeyboardButton("❌ Не знаю", callback_data=CB_EVAL_INCORRECT)],
+    ]
+)
+_NO_ACTIVE_TENSES_KEYBOARD = InlineKeyboardMarkup(
+    [
+        [InlineKeyboardButton("⚙️ Настройки", callback_data=CB_SETTINGS_MENU)],
+        [InlineKeyboardButton("⬅️ Назад", callback_data=CB_TRAIN_MENU)],
+    ]
+)
+_VERB_TRAINER_NEXT_KEYBOARD = InlineKeyboardMarkup(
+    [
+        [InlineKeyboardButton("🔥 Продолжить", callback_data=CB_VERB_TRAINER_START)],
+        [InlineKeyboardButton("⬅️ В меню тренировок", callback_data=CB_TRAIN_MENU)],
+    ]
+)
 
-    if query:
-        await query.answer()
-        await query.edit_message_text(
-            text="Выберите режим тренировки:",
-            reply_markup=InlineKeyboardMarkup(keyboard),
-        )
-    else:
-        await context.bot.send_message(
-            chat_id=update.effective_chat.id,
-            text="Выберите режим тренировки:",
-            reply_markup=InlineKeyboardMarkup(keyboard),
-        )
-
-    return TRAINING_MENU_STATE
-
-
-# --- Логика тренировки "Карточки" (Flashcards) ---
-
-
-@increment_callbacks_counter
-@set_request_id
-async def start_flashcard_training(
-    update: Update, context: ContextTypes.DEFAULT_TYPE
-) -> int:
-    """Начинает тренировку с карточками, учитывая продвинутый режим."""
-    query = update.callback_query
-    await query.answer()
-    user_id = query.from_user.id
-    context.user_data["training_mode"] = query.data
 
+# Синхронные блоки работы с БД: обработчики выполняют их через
+# asyncio.to_thread, чтобы запросы не блокировали цикл событий и другие чаты.
+def _build_flashcard_session(user_id: int) -> Tuple[int, List[Dict[str, Any]]]:
     with UnitOfWork() as uow:
         user_settings = uow.user_settings.get_user_settings(user_id)
 
@@ -97,13 +94,7 @@ async def start_flashcard_training(
         )
 
         if ready_words_count == 0:
-            await query.edit_message_text(
-                "Все слова повторены! Зайдите позже или добавьте новые.",
-                reply_markup=InlineKeyboardMarkup(
-                    [[InlineKeyboardButton("⬅️ Назад", callback_data=CB_TRAIN_MENU)]]
-                ),
-            )
-            return TRAINING_MENU_STATE
+            return 0, []
 
         # Шаг 2: Оптимизированная выборка слов для сессии
         words_for_session = []
@@ -144,13 +135,112 @@ async def start_flashcard_training(
                         item["description"] = description
 
                 words_for_session.append(item)
+    return ready_words_count, words_for_session
+
+
+def _save_self_evaluation(user_id: int, word_id: int, is_correct: bool) -> None:
+    with UnitOfWork() as uow:
+        srs_level = uow.user_dictionary.get_srs_level(user_id, word_id)
+        srs_level = srs_level if srs_level is not None else 0
+        srs_level = srs_level + 1 if is_correct else 0
+
+        srs_intervals = [0, 1, 3, 7, 14, 30, 90]
+        days_to_add = srs_intervals[min(srs_level, len(srs_intervals) - 1)]
+        next_review_date = datetime.now() + timedelta(days=days_to_add)
+
+        uow.user_dictionary.update_srs_level(
+            srs_level, next_review_date, user_id, word_id
+        )
+        uow.commit()
+
+
+def _load_verb_training_item(
+    user_id: int,
+) -> Tuple[List[str], Optional[Tuple[CachedWord, VerbConjugation]], bool]:
+    with UnitOfWork() as uow:
+        user_settings = uow.user_settings.get_user_settings(user_id)
+        if not user_settings.tense_settings:
+            created = uow.user_settings.initialize_tense_settings(user_id)
+            uow.commit()
+            # Пустой RETURNING: настройки параллельно создал другой запрос
+            user_settings = (
+                user_settings.with_tense_settings(created)
+                if created
+                else uow.user_settings.get_user_settings(user_id)
+            )
+
+        active_tenses = user_settings.get_active_tenses()
+        if not active_tenses:
+            return active_tenses, None, False
+
+        training_item = uow.words.get_random_verb_training_item(user_id, active_tenses)
+        # Отличаем пустой словарь от глаголов без форм в выбранных временах
+        has_verbs = training_item is not None or uow.words.count_user_verbs(user_id) > 0
+    return active_tenses, training_item, has_verbs
+
+
+def _reset_srs_level(user_id: int, word_id: int) -> None:
+    with UnitOfWork() as uow:
+        uow.user_dictionary.update_srs_level(
+            0, datetime.now() + timedelta(days=1), user_id, word_id
+        )
+        uow.commit()
+
+
+# --- Вход в меню тренировок ---
+
+
+@increment_callbacks_counter
+@set_request_id
+async def training_menu(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
+    """Отображает меню выбора режима тренировки."""
+    query = update.callback_query
+
+    if query:
+        await query.answer()
+        await query.edit_message_text(
+            text="Выберите режим тренировки:",
+            reply_markup=_TRAINING_MENU_KEYBOARD,
+        )
+    else:
+        await context.bot.send_message(
+            chat_id=update.effective_chat.id,
+            text="Выберите режим тренировки:",
+            reply_markup=_TRAINING_MENU_KEYBOARD,
+        )
+
+    return TRAINING_MENU_STATE
+
+
+# --- Логика тренировки "Карточки" (Flashcards) ---
+
+
+@increment_callbacks_counter
+@set_request_id
+async def start_flashcard_training(
+    update: Update, context: ContextTypes.DEFAULT_TYPE
+) -> int:
+    """Начинает тренировку с карточками, учитывая продвинутый режим."""
+    query = update.callback_query
+    await query.answer()
+    user_id = query.from_user.id
+    context.user_data["training_mode"] = query.data
+
+    ready_words_count, words_for_session = await asyncio.to_thread(
+        _build_flashcard_session, user_id
+    )
+
+    if ready_words_count == 0:
+        await query.edit_message_text(
+            "Все слова повторены! Зайдите позже или добавьте новые.",
+            reply_markup=_BACK_TO_TRAINING_MENU_KEYBOARD,
+        )
+        return TRAINING_MENU_STATE
 
     if not words_for_session:
         await query.edit_message_text(
             "Не нашлось подходящих слов для тренировки. Попробуйте позже.",
-            reply_markup=InlineKeyboardMarkup(
-                [[InlineKeyboardButton("⬅️ Назад", callback_data=CB_TRAIN_MENU)]]
-            ),
+            reply_markup=_BACK_TO_TRAINING_MENU_KEYBOARD,
         )
         return TRAINING_MENU_STATE
 
@@ -215,17 +305,13 @@ async def show_next_card(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
             else:  # Для существительных и прилагательных
                 question += f" ({description})"
 
-    keyboard = [
-        [InlineKeyboardButton("💡 Показать ответ", callback_data=CB_SHOW_ANSWER)],
-        [InlineKeyboardButton("❌ Закончить", callback_data=CB_END_TRAINING)],
-    ]
-
     message_text = f"Слово {idx + 1}/{len(words)}:\n\n*{question}*"
-    reply_markup = InlineKeyboardMarkup(keyboard)
 
     if query:
         await query.edit_message_text(
-            text=message_text, reply_markup=reply_markup, parse_mode=ParseMode.MARKDOWN
+            text=message_text,
+            reply_markup=_FLASHCARD_QUESTION_KEYBOARD,
+            parse_mode=ParseMode.MARKDOWN,
         )
 
     return FLASHCARD_SHOW
@@ -271,13 +357,9 @@ async def show_answer(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int
         # Сценарий: Обычный режим
         answer_text = f"*{base_hebrew}* [{transcription}]\n\nПеревод: *{translation}*"
 
-    keyboard = [
-        [InlineKeyboardButton("✅ Знаю", callback_data=CB_EVAL_CORRECT)],
-        [InlineKeyboardButton("❌ Не знаю", callback_data=CB_EVAL_INCORRECT)],
-    ]
     await query.edit_message_text(
         answer_text,
-        reply_markup=InlineKeyboardMarkup(keyboard),
+        reply_markup=_FLASHCARD_EVAL_KEYBOARD,
         parse_mode=ParseMode.MARKDOWN,
     )
     return FLASHCARD_EVAL
@@ -293,24 +375,12 @@ async def handle_self_evaluation(
     item = context.user_data["words"][context.user_data["idx"]]
     word = item["word"]
 
-    with UnitOfWork() as uow:
-        srs_level = uow.user_dictionary.get_srs_level(query.from_user.id, word.word_id)
-        srs_level = srs_level if srs_level is not None else 0
-
-        if query.data == CB_EVAL_CORRECT:
-            context.user_data["correct"] += 1
-            srs_level += 1
-        else:
-            srs_level = 0
-
-        srs_intervals = [0, 1, 3, 7, 14, 30, 90]
-        days_to_add = srs_intervals[min(srs_level, len(srs_intervals) - 1)]
-        next_review_date = datetime.now() + timedelta(days=days_to_add)
-
-        uow.user_dictionary.update_srs_level(
-            srs_level, next_review_date, query.from_user.id, word.word_id
-        )
-        uow.commit()
+    is_correct = query.data == CB_EVAL_CORRECT
+    if is_correct:
+        context.user_data["correct"] += 1
+    await asyncio.to_thread(
+        _save_self_evaluation, query.from_user.id, word.word_id, is_correct
+    )
 
     context.user_data["idx"] += 1
     return await show_next_card(update, context)
@@ -327,65 +397,40 @@ async def start_verb_trainer(update: Update, context: ContextTypes.DEFAULT_TYPE)
     await query.answer()
     user_id = query.from_user.id
 
-    with UnitOfWork() as uow:
-        user_settings = uow.user_settings.get_user_settings(user_id)
-        if not user_settings.tense_settings:
-            uow.user_settings.initialize_tense_settings(user_id)
-            uow.commit()
-            user_settings = uow.user_settings.get_user_settings(user_id)
+    active_tenses, training_item, has_verbs = await asyncio.to_thread(
+        _load_verb_training_item, user_id
+    )
 
-        active_tenses = user_settings.get_active_tenses()
+    if not active_tenses:
+        await query.edit_message_text(
+            "Чтобы начать тренировку, выберите хотя бы одно время в разделе 'Настройки'.",
+            reply_markup=_NO_ACTIVE_TENSES_KEYBOARD,
+        )
+        return TRAINING_MENU_STATE
 
-        if not active_tenses:
-            keyboard = [
-                [InlineKeyboardButton("⚙️ Настройки", callback_data=CB_SETTINGS_MENU)],
-                [InlineKeyboardButton("⬅️ Назад", callback_data=CB_TRAIN_MENU)],
-            ]
-            await query.edit_message_text(
-                "Чтобы начать тренировку, выберите хотя бы одно время в разделе 'Настройки'.",
-                reply_markup=InlineKeyboardMarkup(keyboard),
-            )
-            return TRAINING_MENU_STATE
-
-        verb, conjugation = None, None
-        for i in range(VERB_TRAINER_RETRY_ATTEMPTS):
-            verb_candidate = uow.words.get_random_verb_for_training(user_id)
-            if not verb_candidate:
-                await query.edit_message_text(
-                    "В вашем словаре нет глаголов для тренировки.",
-                    reply_markup=InlineKeyboardMarkup(
-                        [[InlineKeyboardButton("⬅️ Назад", callback_data=CB_TRAIN_MENU)]]
-                    ),
-                )
-                return TRAINING_MENU_STATE
+    if not has_verbs:
+        await query.edit_message_text(
+            "В вашем словаре нет глаголов для тренировки.",
+            reply_markup=_BACK_TO_TRAINING_MENU_KEYBOARD,
+        )
+        return TRAINING_MENU_STATE
 
-            conjugation_candidate = uow.words.get_random_conjugation_for_word(
-                verb_candidate.word_id, active_tenses
-            )
-            if conjugation_candidate:
-                verb, conjugation = verb_candidate, conjugation_candidate
-                break
-            else:
-                logger.warning(
-                    f"Не найдено спряжений в активных временах для глагола {verb_candidate.hebrew}. Попытка {i + 1}"
-                )
-    if not verb or not conjugation:
+    if training_item is None:
         logger.warning(
-            f"Could not find a suitable verb for training for user after {VERB_TRAINER_RETRY_ATTEMPTS} retries."
+            "Could not find a verb with conjugations in active tenses for user."
         )
         await query.edit_message_text(
             "Не удалось найти подходящий глагол для тренировки. Возможно, для глаголов в вашем словаре нет спряжений в выбранных временах.",
-            reply_markup=InlineKeyboardMarkup(
-                [[InlineKeyboardButton("⬅️ Назад", callback_data=CB_TRAIN_MENU)]]
-            ),
+            reply_markup=_BACK_TO_TRAINING_MENU_KEYBOARD,
         )
         return TRAINING_MENU_STATE
 
+    verb, conjugation = training_item
     context.user_data["answer"] = conjugation
 
-    person_display = PERSON_MAP.get(conjugation.person.value, conjugation.person.value)
+    person_display = PERSON_MAP.get(conjugation.person, conjugation.person.value)
     tense_display = TENSE_MAP.get(
-        conjugation.tense.value, conjugation.tense.value
+        conjugation.tense, conjugation.tense.value
     ).capitalize()
 
     question_text = f"Глагол: *{verb.hebrew}*\n\nНапишите его форму для:\n*{tense_display}, {person_display}*"
@@ -418,22 +463,13 @@ async def check_verb_answer(update: Update, context: ContextTypes.DEFAULT_TYPE)
     else:
         reply_text = f"❌ Ошибка.\n\nПравильный ответ: *{correct_answer.hebrew_form}* [{correct_answer.transcription}]"
 
-    with UnitOfWork() as uow:
-        uow.user_dictionary.update_srs_level(
-            0,
-            datetime.now() + timedelta(days=1),
-            update.effective_user.id,
-            correct_answer.word_id,
-        )
-        uow.commit()
+    await asyncio.to_thread(
+        _reset_srs_level, update.effective_user.id, correct_answer.word_id
+    )
 
-    keyboard = [
-        [InlineKeyboardButton("🔥 Продолжить", callback_data=CB_VERB_TRAINER_START)],
-        [InlineKeyboardButton("⬅️ В меню тренировок", callback_data=CB_TRAIN_MENU)],
-    ]
     await update.message.reply_text(
         reply_text,
-        reply_markup=InlineKeyboardMarkup(keyboard),
+        reply_markup=_VERB_TRAINER_NEXT_KEYBOARD,
         parse_mode=ParseMode.MARKDOWN,
     )
 
@@ -450,27 +486,9 @@ async def end_training(update: Update, context: ContextTypes.DEFAULT_TYPE) -> in
     query = update.callback_query
     await query.answer()
 
-    keyboard = [
-        [
-            InlineKeyboardButton(
-                "🇮🇱 → 🇷🇺 (Иврит → Русский)", callback_data=CB_TRAIN_HE_RU
-            )
-        ],
-        [
-            InlineKeyboardButton(
-                "🇷🇺 → 🇮🇱 (Русский → Иврит)", callback_data=CB_TRAIN_RU_HE
-            )
-        ],
-        [
-            InlineKeyboardButton(
-                "🔥 Глаголы (Спряжение)", callback_data=CB_VERB_TRAINER_START
-            )
-        ],
-        [InlineKeyboardButton("⬅️ В главное меню", callback_data="main_menu")],
-    ]
     await query.edit_message_text(
         text="Тренировка прервана. Выберите новый режим:",
-        reply_markup=InlineKeyboardMarkup(keyboard),
+        reply_markup=_TRAINING_MENU_KEYBOARD,
     )
 
     return TRAINING_MENU_STATE
@@ -1,9 +1,14 @@
 # -*- coding: utf-8 -*-
 
+import asyncio
 import sys
+from collections import deque
+from typing import Awaitable, Deque, Dict, Optional
 
+from telegram import Update
 from telegram.ext import (
     Application,
+    BaseUpdateProcessor,
     CommandHandler,
     MessageHandler,
     CallbackQueryHandler,
@@ -13,8 +18,10 @@ from telegram.ext import (
 
 from config import (
     BOT_TOKEN,
+    configure_logging,
     logger,
     CONVERSATION_TIMEOUT_SECONDS,
+    MAX_CONCURRENT_UPDATES,
     TRAINING_MENU_STATE,
     FLASHCARD_SHOW,
     FLASHCARD_EVAL,
@@ -78,11 +85,132 @@ from handlers.settings import (
     manage_tenses_menu,
     toggle_training_mode_handler,
 )
+from services.connection import db_manager
+
+# Таблица маршрутизации коллбэков: действие ("группа:действие") -> обработчик.
+# Коллбэки тренировок сюда не входят - их обрабатывает ConversationHandler.
+CALLBACK_ROUTES = {
+    "main_menu": main_menu,
+    CB_DICT_VIEW: view_dictionary_page_handler,
+    CB_DICT_DELETE_MODE: view_dictionary_page_handler,
+    CB_DICT_CONFIRM_DELETE: confirm_delete_word,
+    CB_DICT_EXECUTE_DELETE: execute_delete_word,
+    CB_ADD: add_word_to_dictionary,
+    CB_SHOW_VERB: show_verb_conjugations,
+    CB_VIEW_CARD: view_word_card_handler,
+    CB_SHOW_ALL_VERB_FORMS: show_all_verb_forms_handler,
+    CB_SEARCH_PEALIM: pealim_search_handler,
+    CB_SELECT_WORD: select_word_handler,
+    CB_SETTINGS_MENU: settings_menu,
+    CB_TENSES_MENU: manage_tenses_menu,
+    CB_TENSE_TOGGLE: toggle_tense,
+    CB_TOGGLE_TRAINING_MODE: toggle_training_mode_handler,
+}
+# Действия без аргументов совпадают с данными коллбэка целиком ("^действие$"),
+# остальным аргументы обязательны ("^действие:...")
+_ACTIONS_WITHOUT_ARGS = frozenset(
+    {"main_menu", CB_SETTINGS_MENU, CB_TENSES_MENU, CB_TOGGLE_TRAINING_MODE}
+)
+
+
+def get_callback_action(data: str) -> str:
+    """Выделяет действие из данных коллбэка: 'word:add:42' -> 'word:add'."""
+    group, _, rest = data.partition(":")
+    if not rest:
+        return group
+    return f"{group}:{rest.partition(':')[0]}"
+
+
+def is_routed_callback(data: object) -> bool:
+    """Проверяет, есть ли для коллбэка обработчик в таблице маршрутизации."""
+    if not isinstance(data, str):
+        return False
+    action = get_callback_action(data)
+    if action not in CALLBACK_ROUTES:
+        return False
+    has_args = len(data) > len(action)
+    return has_args != (action in _ACTIONS_WITHOUT_ARGS)
+
+
+async def dispatch_callback_query(update, context):
+    """Передает коллбэк обработчику из таблицы маршрутизации."""
+    handler = CALLBACK_ROUTES[get_callback_action(update.callback_query.data)]
+    return await handler(update, context)
+
+
+class PerChatUpdateProcessor(BaseUpdateProcessor):
+    """
+    Обрабатывает обновления разных чатов параллельно, а обновления одного чата -
+    строго по очереди. Медленный поиск в Pealim в одном чате не задерживает
+    остальные, а ConversationHandler видит сообщения чата в исходном порядке.
+
+    Обновления чата складываются в очередь, которую разбирает отдельная задача.
+    Слот PTB освобождается сразу после постановки в очередь, поэтому ожидающие
+    обновления одного чата не занимают общий лимит и не блокируют другие чаты.
+    Число одновременно выполняемых обновлений ограничивает собственный семафор.
+    """
+
+    def __init__(self, max_concurrent_updates: int):
+        super().__init__(max_concurrent_updates)
+        self._running = asyncio.Semaphore(max_concurrent_updates)
+        self._chat_queues: Dict[int, Deque[Awaitable]] = {}
+        self._chat_workers: Dict[int, "asyncio.Task[None]"] = {}
+
+    async def do_process_update(self, update: object, coroutine: Awaitable) -> None:
+        chat_id: Optional[int] = None
+        if isinstance(update, Update) and update.effective_chat:
+            chat_id = update.effective_chat.id
+        if chat_id is None:
+            async with self._running:
+                await coroutine
+            return
+
+        queue = self._chat_queues.get(chat_id)
+        if queue is None:
+            queue = self._chat_queues[chat_id] = deque()
+        queue.append(coroutine)
+        if chat_id not in self._chat_workers:
+            self._chat_workers[chat_id] = asyncio.create_task(
+                self._run_chat(chat_id, queue)
+            )
+
+    async def _run_chat(self, chat_id: int, queue: Deque[Awaitable]) -> None:
+        """Выполняет обновления чата по одному, пока очередь не опустеет."""
+        try:
+            while queue:
+                coroutine = queue.popleft()
+                try:
+                    async with self._running:
+                        await coroutine
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    logger.exception("Ошибка обработки обновления чата %s", chat_id)
+        finally:
+            # При отмене закрываем невыполненные корутины, чтобы не было
+            # предупреждений "coroutine was never awaited"
+            while queue:
+                queue.popleft().close()
+            del self._chat_queues[chat_id]
+            del self._chat_workers[chat_id]
+
+    async def initialize(self) -> None:
+        pass
+
+    async def shutdown(self) -> None:
+        """Дожидается обработки уже поставленных в очередь обновлений."""
+        while self._chat_workers:
+            await asyncio.gather(*self._chat_workers.values(), return_exceptions=True)
 
 
 def build_application() -> Application:
     """Строит и возвращает объект Application."""
-    application = Application.builder().token(BOT_TOKEN).build()
+    application = (
+        Application.builder()
+        .token(BOT_TOKEN)
+        .concurrent_updates(PerChatUpdateProcessor(MAX_CONCURRENT_UPDATES))
+        .build()
+    )
 
     conv_defaults = {
         "per_user": True,
@@ -136,60 +264,10 @@ def build_application() -> Application:
     )
 
     application.add_handler(CommandHandler("start", start))
-    application.add_handler(CallbackQueryHandler(main_menu, pattern="^main_menu$"))
-
-    application.add_handler(
-        CallbackQueryHandler(
-            view_dictionary_page_handler,
-            pattern=f"^({CB_DICT_VIEW}|{CB_DICT_DELETE_MODE}):",
-        )
-    )
-    application.add_handler(
-        CallbackQueryHandler(confirm_delete_word, pattern=f"^{CB_DICT_CONFIRM_DELETE}:")
-    )
-    application.add_handler(
-        CallbackQueryHandler(execute_delete_word, pattern=f"^{CB_DICT_EXECUTE_DELETE}:")
-    )
-
-    application.add_handler(
-        CallbackQueryHandler(add_word_to_dictionary, pattern=f"^{CB_ADD}:")
-    )
-    application.add_handler(
-        CallbackQueryHandler(show_verb_conjugations, pattern=f"^{CB_SHOW_VERB}:")
-    )
-    application.add_handler(
-        CallbackQueryHandler(view_word_card_handler, pattern=f"^{CB_VIEW_CARD}:")
-    )
-
-    application.add_handler(
-        CallbackQueryHandler(
-            show_all_verb_forms_handler, pattern=f"^{CB_SHOW_ALL_VERB_FORMS}:"
-        )
-    )
-
-    application.add_handler(
-        CallbackQueryHandler(pealim_search_handler, pattern=f"^{CB_SEARCH_PEALIM}:")
-    )
-
-    application.add_handler(
-        CallbackQueryHandler(select_word_handler, pattern=f"^{CB_SELECT_WORD}:")
-    )
-
-    # Обработчики настроек
-    application.add_handler(
-        CallbackQueryHandler(settings_menu, pattern=f"^{CB_SETTINGS_MENU}$")
-    )
+    # Все коллбэки верхнего уровня обслуживает один обработчик с O(1) маршрутизацией
+    # по таблице вместо цепочки regex-проверок для каждого зарегистрированного хендлера.
     application.add_handler(
-        CallbackQueryHandler(manage_tenses_menu, pattern=f"^{CB_TENSES_MENU}$")
-    )
-    application.add_handler(
-        CallbackQueryHandler(toggle_tense, pattern=f"^{CB_TENSE_TOGGLE}:")
-    )
-
-    application.add_handler(
-        CallbackQueryHandler(
-            toggle_training_mode_handler, pattern=f"^{CB_TOGGLE_TRAINING_MODE}$"
-        )
+        CallbackQueryHandler(dispatch_callback_query, pattern=is_routed_callback)
     )
 
     application.add_handler(training_conv)
@@ -202,6 +280,7 @@ def build_application() -> Application:
 
 def main() -> None:
     """Основная функция для запуска бота."""
+    configure_logging()
     if BOT_TOKEN is None:
         logger.critical(
             "Токен бота не найден. Укажите TELEGRAM_BOT_TOKEN в .env файле."
@@ -211,7 +290,10 @@ def main() -> None:
 
     application = build_application()
     logger.info("Бот запускается...")
-    application.run_polling()
+    try:
+        application.run_polling()
+    finally:
+        db_manager.close()
 
 
 if __name__ == "__main__":
@@ -34,18 +34,23 @@ CALLBACKS_COUNTER = create_metric(
 
 
 def increment_callbacks_counter(func):
+    # Связанный метод берем один раз при декорировании, а не на каждый вызов
+    inc = CALLBACKS_COUNTER.inc
+
     @wraps(func)
     async def wrapper(*args, **kwargs):
-        CALLBACKS_COUNTER.inc()
+        inc()
         return await func(*args, **kwargs)
 
     return wrapper
 
 
 def increment_messages_counter(func):
+    inc = MESSAGES_COUNTER.inc
+
     @wraps(func)
     async def wrapper(*args, **kwargs):
-        MESSAGES_COUNTER.inc()
+        inc()
         return await func(*args, **kwargs)
 
     return wrapper
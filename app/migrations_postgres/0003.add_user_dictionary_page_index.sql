@@ -0,0 +1,5 @@
+-- step: 1
+-- description: Index user_dictionary for dictionary page ordering
+
+CREATE INDEX IF NOT EXISTS idx_user_dictionary_user_added
+    ON user_dictionary (user_id, added_at DESC, word_id DESC);
@@ -0,0 +1,5 @@
+-- step: 1
+-- description: Index user_dictionary for training ordering
+
+CREATE INDEX IF NOT EXISTS idx_user_dictionary_user_next_review
+    ON user_dictionary (user_id, next_review_at);
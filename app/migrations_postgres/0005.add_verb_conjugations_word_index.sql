@@ -0,0 +1,5 @@
+-- step: 1
+-- description: Index verb_conjugations by word and tense
+
+CREATE INDEX IF NOT EXISTS idx_verb_conjugations_word_tense
+    ON verb_conjugations (word_id, tense);
@@ -0,0 +1,10 @@
+-- step: 1
+-- description: Make normalized form indexes cover word_id
+
+CREATE INDEX IF NOT EXISTS idx_cached_words_normalized_word
+    ON cached_words (normalized_hebrew, word_id);
+CREATE INDEX IF NOT EXISTS idx_verb_conjugations_normalized_word
+    ON verb_conjugations (normalized_hebrew_form, word_id);
+
+DROP INDEX IF EXISTS idx_normalized_hebrew;
+DROP INDEX IF EXISTS idx_normalized_hebrew_form;
@@ -1,21 +1,50 @@
 # -*- coding: utf-8 -*-
 import logging
+import queue
 import sqlite3
 import threading
+from datetime import datetime
 from types import TracebackType
 from typing import Optional, Type, Union
 
 import psycopg2
 from psycopg2.extensions import connection as psycopg2_connection
 from psycopg2.extras import DictCursor
+from psycopg2.pool import ThreadedConnectionPool
 
-from config import DATABASE_URL
+from config import DATABASE_URL, DB_POOL_MAX_SIZE, DB_POOL_MIN_SIZE
 
 logger = logging.getLogger(__name__)
 
 # Определяем общий тип для соединений, чтобы использовать в аннотациях
 Connection = Union[sqlite3.Connection, psycopg2_connection]
 
+# Настройки SQLite, применяемые один раз при открытии соединения:
+# WAL - читатели не блокируют писателя (и наоборот), busy_timeout - ждать
+# освобождения блокировки вместо немедленной ошибки SQLITE_BUSY.
+# Для чтения: временные B-деревья сортировок в памяти, mmap до 256 МБ
+# вместо read() и страничный кэш ~20 МБ (отрицательное значение - в КиБ).
+# WAL требует права на запись в каталог с файлом БД (файлы -wal и -shm).
+SQLITE_PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA busy_timeout=5000;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA mmap_size=268435456;
+    PRAGMA cache_size=-20000;
+"""
+
+
+def _adapt_datetime(value: datetime) -> str:
+    return value.isoformat(" ")
+
+
+# Явный адаптер datetime для SQLite: регистрируется один раз на процесс и
+# заменяет встроенный, объявленный устаревшим в Python 3.12. Формат тот же
+# ("YYYY-MM-DD HH:MM:SS[.ffffff]"), поэтому сравнения с CURRENT_TIMESTAMP
+# и чтение через datetime.fromisoformat не меняются.
+sqlite3.register_adapter(datetime, _adapt_datetime)
+
 
 class DatabaseConnectionManager:
     """
@@ -29,8 +58,90 @@ class DatabaseConnectionManager:
         self._lock = threading.Lock()
         self.is_postgres = self.db_url.startswith("postgres")
         self.db_schema = db_schema
+        self._pool: Optional[ThreadedConnectionPool] = None
+        # ThreadedConnectionPool не ждет свободного соединения, а сразу
+        # бросает PoolError: при параллельной обработке обновлений потоки
+        # ждут свободного места в пуле на семафоре
+        self._pool_slots = threading.BoundedSemaphore(DB_POOL_MAX_SIZE)
+        # Свободные соединения SQLite: страничный кэш и PRAGMA сохраняются
+        # между единицами работы. LIFO - чаще выдается самое "теплое".
+        self._sqlite_idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue(
+            maxsize=DB_POOL_MAX_SIZE
+        )
         logger.debug(f"Инициализирован менеджер соединений для '{self.db_url}'")
 
+    def acquire(self) -> Connection:
+        """
+        Выдает соединение для одной единицы работы. Для PostgreSQL - из пула
+        (без нового TCP-подключения и аутентификации на каждый запрос бота),
+        для SQLite - свободное соединение из очереди или новое. Единицы работы
+        выполняются в потоках, поэтому у каждой свое соединение SQLite.
+        """
+        if not self.is_postgres:
+            try:
+                return self._sqlite_idle.get_nowait()
+            except queue.Empty:
+                return self._connect_sqlite()
+        self._pool_slots.acquire()
+        try:
+            with self._lock:
+                if self._pool is None:
+                    self._pool = self._create_pool()
+            return self._pool.getconn()
+        except BaseException:
+            self._pool_slots.release()
+            raise
+
+    def release(self, connection: Connection) -> None:
+        """Возвращает соединение, полученное через acquire()."""
+        if not self.is_postgres:
+            try:
+                self._sqlite_idle.put_nowait(connection)
+            except queue.Full:
+                connection.close()
+            return
+        try:
+            if self._pool is not None:
+                # Разорванное соединение пул закрывает, а не выдает повторно
+                self._pool.putconn(connection, close=bool(connection.closed))
+        finally:
+            self._pool_slots.release()
+
+    def close(self) -> None:
+        """Закрывает все соединения пула."""
+        with self._lock:
+            if self._pool is not None:
+                self._pool.closeall()
+                self._pool = None
+        while True:
+            try:
+                self._sqlite_idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+    def _create_pool(self) -> ThreadedConnectionPool:
+        logger.info(f"Создание пула соединений с БД: {self.db_url}")
+        connect_kwargs = {"cursor_factory": DictCursor}
+        if self.db_schema:
+            # search_path задается при подключении, чтобы действовать
+            # для каждого соединения пула
+            connect_kwargs["options"] = f"-c search_path={self.db_schema}"
+        try:
+            return ThreadedConnectionPool(
+                DB_POOL_MIN_SIZE, DB_POOL_MAX_SIZE, self.db_url, **connect_kwargs
+            )
+        except psycopg2.OperationalError:
+            logger.error(f"Не удалось подключиться к БД: {self.db_url}", exc_info=True)
+            raise
+
+    def _connect_sqlite(self) -> sqlite3.Connection:
+        # check_same_thread=False: соединение из очереди может достаться
+        # другому потоку, но одновременно им пользуется только одна единица работы
+        connection = sqlite3.connect(self.db_url, uri=True, check_same_thread=False)
+        connection.row_factory = sqlite3.Row
+        connection.executescript(SQLITE_PRAGMAS)
+        return connection
+
     def __enter__(self) -> Connection:
         with self._lock:
             if self.connection:
@@ -48,10 +159,7 @@ class DatabaseConnectionManager:
                         self.connection.commit()
                 else:
                     # Для SQLite используем старую логику с URI
-                    self.connection = sqlite3.connect(
-                        self.db_url, uri=True, check_same_thread=False
-                    )
-                    self.connection.row_factory = sqlite3.Row
+                    self.connection = self._connect_sqlite()
 
                 logger.info(f"Успешное подключение к {self.db_url}")
                 return self.connection
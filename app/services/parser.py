@@ -9,7 +9,7 @@ from bs4 import BeautifulSoup
 from pydantic import ValidationError, TypeAdapter
 
 from config import logger, PARSING_TIMEOUT
-from dal.models import CreateCachedWord
+from dal.models import CachedWord, CreateCachedWord
 from dal.unit_of_work import UnitOfWork
 from services.parsing_strategies import (
     get_parsing_strategy,
@@ -21,6 +21,9 @@ from utils import normalize_hebrew
 PARSING_EVENTS: Dict[str, asyncio.Event] = {}
 PARSING_EVENTS_LOCK = asyncio.Lock()
 
+# Схема валидации строится один раз при импорте, а не на каждое слово
+CREATE_WORD_ADAPTER: TypeAdapter[CreateCachedWord] = TypeAdapter(CreateCachedWord)
+
 
 async def _parse_disambiguation_page(
     soup: BeautifulSoup, client: httpx.AsyncClient, base_url: str
@@ -127,9 +130,7 @@ def _create_word_model_from_parsed_data(
             for conj in parsed_data["conjugations"]:
                 conj["normalized_hebrew_form"] = normalize_hebrew(conj["hebrew_form"])
 
-        adapter = TypeAdapter(CreateCachedWord)
-        validated_model = adapter.validate_python(parsed_data)
-        return validated_model
+        return CREATE_WORD_ADAPTER.validate_python(parsed_data)
     except ValidationError as e:
         logger.error(
             f"Ошибка валидации данных после парсинга для слова '{parsed_data.get('hebrew')}': {e}"
@@ -137,6 +138,48 @@ def _create_word_model_from_parsed_data(
         return None
 
 
+# Синхронные блоки работы с БД выполняются через asyncio.to_thread, чтобы
+# запросы не останавливали цикл событий на время внешнего поиска.
+def _find_cached_words(normalized_word: str) -> List[CachedWord]:
+    with UnitOfWork() as uow:
+        return uow.words.find_words_by_normalized_form(normalized_word)
+
+
+def _save_parsed_words(parsed_data_list: List[CreateCachedWord]) -> List[CachedWord]:
+    word_ids = []
+
+    with UnitOfWork() as uow:
+        for word_data in parsed_data_list:
+            # Проверка на дубликаты перед созданием
+            existing_words = uow.words.find_words_by_normalized_form(
+                word_data.normalized_hebrew
+            )
+            is_duplicate = any(
+                w.hebrew == word_data.hebrew
+                and w.part_of_speech == word_data.part_of_speech
+                for w in existing_words
+            )
+
+            if not is_duplicate:
+                word_id = uow.words.create_cached_word(word_data)
+                word_ids.append(word_id)
+                logger.debug(
+                    f'{{"event": "word_cached_to_db", "word_id": {word_id}, "hebrew": "{word_data.hebrew}"}}'
+                )
+            else:
+                # Если слово уже есть, находим его ID для возврата
+                existing_word = next(
+                    (w for w in existing_words if w.hebrew == word_data.hebrew),
+                    None,
+                )
+                if existing_word:
+                    word_id = existing_word.word_id
+                    word_ids.append(word_id)
+
+    with UnitOfWork() as uow:
+        return uow.words.get_words_by_ids(word_ids)
+
+
 async def fetch_and_cache_word_data(search_word: str) -> Tuple[str, List[Dict]]:
     """
     Асинхронная функция-диспетчер парсинга. Нормализует, ищет, парсит и сохраняет данные.
@@ -165,10 +208,9 @@ async def fetch_and_cache_word_data(search_word: str) -> Tuple[str, List[Dict]]:
             logger.info(
                 f'{{"event": "await_finished", "search_word": "{search_word}"}}'
             )
-            with UnitOfWork() as uow:
-                results = uow.words.find_words_by_normalized_form(
-                    normalized_search_word
-                )
+            results = await asyncio.to_thread(
+                _find_cached_words, normalized_search_word
+            )
             if len(results) > 0:
                 logger.info(
                     f'{{"event": "found_in_cache_after_await", "status": "ok", "results_count": {len(results)}}}'
@@ -221,42 +263,7 @@ async def fetch_and_cache_word_data(search_word: str) -> Tuple[str, List[Dict]]:
                 )
                 return "error", None
 
-        word_ids = []
-
-        with UnitOfWork() as uow:
-            for word_data in parsed_data_list:
-                # Проверка на дубликаты перед созданием
-                existing_words = uow.words.find_words_by_normalized_form(
-                    word_data.normalized_hebrew
-                )
-                is_duplicate = any(
-                    w.hebrew == word_data.hebrew
-                    and w.part_of_speech == word_data.part_of_speech
-                    for w in existing_words
-                )
-
-                if not is_duplicate:
-                    word_id = uow.words.create_cached_word(word_data)
-                    word_ids.append(word_id)
-                    logger.debug(
-                        f'{{"event": "word_cached_to_db", "word_id": {word_id}, "hebrew": "{word_data.hebrew}"}}'
-                    )
-                else:
-                    # Если слово уже есть, находим его ID для возврата
-                    existing_word = next(
-                        (w for w in existing_words if w.hebrew == word_data.hebrew),
-                        None,
-                    )
-                    if existing_word:
-                        word_id = existing_word.word_id
-                        word_ids.append(word_id)
-
-        final_words_data = []
-        with UnitOfWork() as uow:
-            for word_id in word_ids:
-                result = uow.words.get_word_by_id(word_id)
-                if result:
-                    final_words_data.append(result)
+        final_words_data = await asyncio.to_thread(_save_parsed_words, parsed_data_list)
 
         logger.info(
             f'{{"event": "fetch_success", "status": "ok", "final_count": {len(final_words_data)}}}'
@@ -1,9 +1,10 @@
 # -*- coding: utf-8 -*-
 
+import asyncio
 import re
-from typing import List, Dict, Any
+from typing import Any, Coroutine, Dict, List, Set
 import uuid
-from functools import wraps
+from functools import lru_cache, wraps
 from config import logger
 from context import request_id_var, username_var, handler_name_var
 
@@ -45,15 +46,56 @@ def set_request_id(func):
     return wrapper
 
 
+# Ссылки на фоновые задачи: цикл событий хранит только слабые ссылки,
+# и незавершенную задачу без них может собрать сборщик мусора
+_background_tasks: Set[asyncio.Task] = set()
+
+
+def _on_background_task_done(task: asyncio.Task) -> None:
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Ошибка в фоновой задаче", exc_info=task.exception())
+
+
+def fire_and_forget(coro: Coroutine) -> asyncio.Task:
+    """
+    Запускает корутину в фоне, не дожидаясь результата (например, ответ на
+    callback_query, пока обработчик читает БД). Ошибки только логируются.
+    """
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_on_background_task_done)
+    return task
+
+
+def parse_callback_args(data: str, count: int) -> List[str]:
+    """
+    Возвращает последние count полей callback_data вида "группа:действие:...".
+    rsplit с ограничением не разбивает префикс на лишние части.
+    """
+    return data.rsplit(":", count)[1:]
+
+
+def parse_callback_int(data: str) -> int:
+    """Последнее поле callback_data как int, без разбиения строки на список."""
+    return int(data[data.rfind(":") + 1 :])
+
+
+# Таблица для str.translate, удаляющая огласовки и знаки кантилляции
+_NIQQUD_DELETE = dict.fromkeys(range(0x0591, 0x05C8))
+
+
+@lru_cache(maxsize=4096)
 def normalize_hebrew(text: str) -> str:
     """
     Нормализует текст на иврите: удаляет огласовки (никуд) и
     приводит к базовой форме написания.
+    Результат кэшируется: запросы пользователей часто повторяются.
     """
     if not text:
         return ""
-    # Удаление всех огласовок (U+0591 до U+05C7)
-    text = re.sub(r"[\u0591-\u05C7]", "", text)
+    # Удаление всех огласовок (U+0591 до U+05C7) за один проход translate
+    text = text.translate(_NIQQUD_DELETE)
     # Базовые правила унификации (можно расширять)
     # text = text.replace('יי', 'י')
     # text = text.replace('וו', 'ו')
@@ -8,7 +8,7 @@ import uuid
 import config
 import dal.unit_of_work
 from dal.unit_of_work import UnitOfWork
-from dal.repositories import UserSettingsRepository
+from dal.repositories import UserSettingsRepository, WordRepository
 import services.connection
 from services.connection import DatabaseConnectionManager
 
@@ -115,6 +115,14 @@ def patch_db_url(monkeypatch, db_separate_schema):
     monkeypatch.setattr(services.connection, "db_manager", new_manager)
     monkeypatch.setattr(dal.unit_of_work, "db_manager", new_manager)
 
+    # 4. В новой схеме word_id начинаются заново, кэш слов прошлого теста невалиден
+    WordRepository.cache_clear()
+
+    yield new_manager
+
+    # 5. Закрываем пул соединений теста, чтобы не копить открытые соединения
+    new_manager.close()
+
 
 @pytest.fixture(scope="function")
 def unique_user_id() -> int:
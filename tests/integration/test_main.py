@@ -1,4 +1,7 @@
-from main import build_application, main
+import asyncio
+
+import pytest
+from main import PerChatUpdateProcessor, build_application, main
 from telegram.ext import Application
 from unittest.mock import MagicMock, patch
 
@@ -8,6 +11,7 @@ def test_build_application(monkeypatch):
     monkeypatch.setattr("main.BOT_TOKEN", "test_token")
     application = build_application()
     assert isinstance(application, Application)
+    assert isinstance(application.update_processor, PerChatUpdateProcessor)
 
 
 def test_no_token(monkeypatch):
@@ -16,3 +20,113 @@ def test_no_token(monkeypatch):
     with patch("main.sys.exit", new_callable=MagicMock) as sys_exit:
         main()
         sys_exit.assert_called_once_with("Токен не найден.")
+
+
+def test_callback_routing():
+    """Тестирует выделение действия из коллбэка и поиск обработчика."""
+    from main import CALLBACK_ROUTES, get_callback_action, is_routed_callback
+    from handlers.search import add_word_to_dictionary
+
+    assert get_callback_action("word:add:42") == "word:add"
+    assert get_callback_action("settings:menu") == "settings:menu"
+    assert get_callback_action("main_menu") == "main_menu"
+    assert CALLBACK_ROUTES[get_callback_action("word:add:42")] is add_word_to_dictionary
+    assert is_routed_callback("dict:view:0")
+    # Коллбэки тренировок обрабатывает ConversationHandler
+    assert not is_routed_callback("train:menu")
+    assert not is_routed_callback(None)
+    # Действие должно совпадать целиком, а аргументы - соответствовать маршруту
+    assert not is_routed_callback("settings:tense_toggle_extra")
+    assert not is_routed_callback("settings:tense_toggle")
+    assert not is_routed_callback("settings:menu:extra")
+    assert not is_routed_callback("main_menu:1")
+    assert not is_routed_callback("word:add")
+    assert is_routed_callback("settings:menu")
+    assert is_routed_callback("settings:tense_toggle:imp")
+
+
+@pytest.mark.asyncio
+async def test_per_chat_update_processor_orders_within_chat():
+    """Обновления одного чата идут по очереди, разные чаты - параллельно."""
+    from telegram import Chat, Message, Update
+    from datetime import datetime
+
+    def make_update(update_id, chat_id):
+        message = Message(
+            message_id=update_id,
+            date=datetime.now(),
+            chat=Chat(id=chat_id, type="private"),
+            text="שלום",
+        )
+        return Update(update_id=update_id, message=message)
+
+    processor = PerChatUpdateProcessor(8)
+    events = []
+    release_slow = asyncio.Event()
+
+    async def slow(name):
+        events.append(f"{name}:start")
+        await release_slow.wait()
+        events.append(f"{name}:end")
+
+    async def fast(name):
+        events.append(f"{name}:start")
+        events.append(f"{name}:end")
+
+    await processor.process_update(make_update(1, 1), slow("a1"))
+    await processor.process_update(make_update(2, 1), fast("a2"))
+    await processor.process_update(make_update(3, 2), fast("b1"))
+    await asyncio.sleep(0.01)
+    # Чат 2 не ждет медленное обновление чата 1, второе обновление чата 1 ждет
+    assert events == ["a1:start", "b1:start", "b1:end"]
+
+    release_slow.set()
+    await processor.shutdown()
+    assert events[3:] == ["a1:end", "a2:start", "a2:end"]
+    # Простаивающие чаты не держат очереди
+    assert not processor._chat_queues
+    assert not processor._chat_workers
+
+
+@pytest.mark.asyncio
+async def test_per_chat_update_processor_queue_does_not_hold_slots():
+    """Очередь одного чата не занимает общий лимит и не блокирует другие чаты."""
+    from telegram import Chat, Message, Update
+    from datetime import datetime
+
+    def make_update(update_id, chat_id):
+        message = Message(
+            message_id=update_id,
+            date=datetime.now(),
+            chat=Chat(id=chat_id, type="private"),
+            text="שלום",
+        )
+        return Update(update_id=update_id, message=message)
+
+    processor = PerChatUpdateProcessor(2)
+    release = asyncio.Event()
+    handled = []
+
+    async def blocked(name):
+        await release.wait()
+        handled.append(name)
+
+    async def fast(name):
+        handled.append(name)
+
+    for update_id in range(1, 6):
+        await asyncio.wait_for(
+            processor.process_update(
+                make_update(update_id, 1), blocked(f"a{update_id}")
+            ),
+            timeout=1,
+        )
+    await asyncio.wait_for(
+        processor.process_update(make_update(10, 2), fast("b1")), timeout=1
+    )
+    await asyncio.sleep(0.01)
+    assert handled == ["b1"]
+
+    release.set()
+    await processor.shutdown()
+    assert handled == ["b1", "a1", "a2", "a3", "a4", "a5"]
@@ -70,7 +70,7 @@ async def test_fetch_and_cache_new_word_successfully(monkeypatch):
     mock_uow.__enter__().words.find_words_by_normalized_form.return_value = []
     mock_uow.__enter__().words.create_cached_word.return_value = 10
 
-    # Создаем ПОЛНОСТЬЮ ВАЛИДНЫЙ объект CachedWord для возврата из get_word_by_id
+    # Создаем ПОЛНОСТЬЮ ВАЛИДНЫЙ объект CachedWord для возврата из get_words_by_ids
     final_word_from_db = CachedWord(
         word_id=10,
         fetched_at=datetime.now(),
@@ -89,7 +89,7 @@ async def test_fetch_and_cache_new_word_successfully(monkeypatch):
             )
         ],
     )
-    mock_uow.__enter__().words.get_word_by_id.return_value = final_word_from_db
+    mock_uow.__enter__().words.get_words_by_ids.return_value = [final_word_from_db]
     monkeypatch.setattr("services.parser.UnitOfWork", lambda: mock_uow)
 
     # --- Выполнение ---
@@ -169,7 +169,7 @@ async def test_fetch_and_cache_word_already_in_cache(monkeypatch):
     mock_uow.__enter__().words.find_words_by_normalized_form.return_value = [
         existing_word_in_db
     ]
-    mock_uow.__enter__().words.get_word_by_id.return_value = existing_word_in_db
+    mock_uow.__enter__().words.get_words_by_ids.return_value = [existing_word_in_db]
     monkeypatch.setattr("services.parser.UnitOfWork", lambda: mock_uow)
 
     # Выполнение
@@ -179,8 +179,8 @@ async def test_fetch_and_cache_word_already_in_cache(monkeypatch):
     assert status == "ok"
     assert len(data) == 1
     assert data[0].word_id == 10
-    mock_uow.__enter__().words.get_word_by_id.assert_called_once_with(
-        existing_word_in_db.word_id
+    mock_uow.__enter__().words.get_words_by_ids.assert_called_once_with(
+        [existing_word_in_db.word_id]
     )
     mock_uow.__enter__().words.create_cached_word.assert_not_called()
 
@@ -13,6 +13,7 @@ from dal.models import (
     PartOfSpeech,
 )
 from handlers.common import start, main_menu, back_to_main_menu, display_word_card
+from telegram.error import BadRequest
 from telegram.ext import ConversationHandler
 from handlers.dictionary import (
     view_dictionary_page_handler,
@@ -41,15 +42,14 @@ from handlers.training import (
 from config import (
     CB_EVAL_CORRECT,
     CB_EVAL_INCORRECT,
-    VERB_TRAINER_RETRY_ATTEMPTS,
     CB_SEARCH_PEALIM,
     CB_SELECT_WORD,
     CB_SETTINGS_MENU,
     CB_TRAIN_HE_RU,
     CB_TRAIN_RU_HE,
+    DICT_WORDS_PER_PAGE,
 )
 
-
 # --- Тесты для общих обработчиков (не требуют патчинга БД) ---
 
 
@@ -234,6 +234,35 @@ async def test_display_word_card(
     assert sent_button_texts == expected_buttons
 
 
+@pytest.mark.asyncio
+async def test_display_word_card_ignores_message_not_modified():
+    """Тест: повторная отрисовка той же карточки не считается ошибкой."""
+    context = AsyncMock()
+    context.bot.edit_message_text.side_effect = BadRequest(
+        "Message is not modified: specified new message content and reply markup "
+        "are exactly the same as a current content and reply markup of the message"
+    )
+    word = CachedWord(
+        word_id=1,
+        hebrew="שלום",
+        normalized_hebrew="שלום",
+        part_of_speech="noun",
+        translations=[
+            Translation(
+                translation_id=1, word_id=1, translation_text="мир", is_primary=True
+            )
+        ],
+        fetched_at=datetime.now(),
+    )
+
+    with patch("handlers.common.logger") as mock_logger:
+        await display_word_card(context, 123, 456, word, 789, in_dictionary=False)
+
+    context.bot.edit_message_text.assert_called_once()
+    mock_logger.warning.assert_called_once()
+    mock_logger.error.assert_not_called()
+
+
 # --- Тесты для словаря (Dictionary Handlers) ---
 
 
@@ -408,6 +437,43 @@ async def test_delete_word_flow():
     )
 
 
+@pytest.mark.asyncio
+async def test_delete_last_word_on_page_redirects_to_last_page():
+    """Тест: после удаления последнего слова на странице показывается последняя непустая."""
+    update = AsyncMock()
+    context = MagicMock()
+    update.callback_query.from_user.id = 123
+    update.callback_query.data = "dict:execute_delete:7:3"
+
+    word = CachedWord(
+        word_id=1,
+        hebrew="שלום",
+        normalized_hebrew="שלום",
+        fetched_at=datetime.now(),
+        translations=[],
+    )
+
+    with patch("handlers.dictionary.UnitOfWork") as mock_uow_class:
+        mock_uow_instance = mock_uow_class.return_value.__enter__.return_value
+        mock_uow_instance.user_dictionary.get_dictionary_page.side_effect = [
+            [],
+            [word],
+        ]
+        mock_uow_instance.user_dictionary.count_dictionary_words.return_value = (
+            DICT_WORDS_PER_PAGE + 1
+        )
+
+        await execute_delete_word(update, context)
+
+    # Страница 3 пуста, слов на полторы страницы - сразу страница 1 (вторая)
+    page_calls = mock_uow_instance.user_dictionary.get_dictionary_page.call_args_list
+    assert [c.args[1] for c in page_calls] == [3, 1]
+    assert (
+        "Ваш словарь (стр. 2):"
+        in update.callback_query.edit_message_text.call_args.args[0]
+    )
+
+
 # --- Тесты для поиска (Search Handlers) ---
 
 
@@ -689,6 +755,7 @@ async def test_select_word_handler():
     with patch("handlers.search.UnitOfWork") as mock_uow_class:
         mock_uow_instance = mock_uow_class.return_value.__enter__.return_value
         mock_uow_instance.words.get_word_by_id.return_value = mock_word_data
+        mock_uow_instance.user_dictionary.is_word_in_dictionary.return_value = False
 
         with patch(
             "handlers.search.display_word_card", new_callable=AsyncMock
@@ -704,6 +771,11 @@ async def test_select_word_handler():
             # И что у нее тоже есть кнопка для повторного поиска
             assert call_kwargs["show_pealim_search_button"] is True
             assert call_kwargs["search_query"] == "חלב"
+            # Признак "в словаре" получен вместе со словом
+            mock_uow_instance.user_dictionary.is_word_in_dictionary.assert_called_once_with(
+                123, 10
+            )
+            assert call_kwargs["in_dictionary"] is False
 
 
 @pytest.mark.asyncio
@@ -811,11 +883,12 @@ async def test_start_verb_trainer_no_verbs():
     # ИСПРАВЛЕНИЕ: убран префикс 'app.'
     with patch("handlers.training.UnitOfWork") as mock_uow_class:
         mock_uow_instance = mock_uow_class.return_value.__enter__.return_value
-        mock_uow_instance.words.get_random_verb_for_training.return_value = None
+        mock_uow_instance.words.get_random_verb_training_item.return_value = None
+        mock_uow_instance.words.count_user_verbs.return_value = 0
 
         await start_verb_trainer(update, context)
 
-    mock_uow_instance.words.get_random_verb_for_training.assert_called_with(user_id)
+    mock_uow_instance.words.count_user_verbs.assert_called_with(user_id)
     update.callback_query.edit_message_text.assert_called_once()
     assert (
         "В вашем словаре нет глаголов для тренировки"
@@ -938,7 +1011,11 @@ async def test_flashcard_training_flow(
     "text_input, error_message",
     [
         ("word", "Пожалуйста, используйте только буквы иврита, пробелы и дефисы."),
+        ("שלום1", "Пожалуйста, используйте только буквы иврита, пробелы и дефисы."),
+        ("   ", "Пожалуйста, используйте только буквы иврита, пробелы и дефисы."),
         ("שלום לך", "Пожалуйста, отправляйте только по одному слову за раз."),
+        ("שלום\nלך", "Пожалуйста, отправляйте только по одному слову за раз."),
+        ("שלום לך!", "Пожалуйста, используйте только буквы иврита, пробелы и дефисы."),
     ],
 )
 async def test_handle_text_message_invalid_input(text_input, error_message):
@@ -1044,8 +1121,9 @@ async def test_show_verb_conjugations_uses_settings():
 
     with patch("handlers.search.UnitOfWork") as mock_uow_class:
         mock_uow = mock_uow_class.return_value.__enter__.return_value
-        mock_uow.words.get_word_hebrew_by_id.return_value = "לכתוב"
-        mock_uow.words.get_conjugations_for_word.return_value = mock_conjugations
+        mock_uow.words.get_word_by_id.return_value = MagicMock(
+            hebrew="לכתוב", conjugations=mock_conjugations
+        )
         mock_uow.user_settings.get_user_settings.return_value = user_settings
         # Мокаем проверку на существование настроек
         mock_uow.user_settings.get_tense_settings.return_value = {
@@ -1065,6 +1143,48 @@ async def test_show_verb_conjugations_uses_settings():
         assert "👁️ Показать остальные времена" in keyboard[0][0].text
 
 
+@pytest.mark.asyncio
+async def test_show_verb_conjugations_truncates_long_table():
+    """Тест: слишком длинная таблица спряжений обрезается до лимита Telegram."""
+    update = AsyncMock()
+    update.callback_query.data = "verb:show:1"
+    update.callback_query.from_user.id = 123
+    context = MagicMock()
+
+    mock_conjugations = [
+        VerbConjugation(
+            id=i,
+            word_id=1,
+            tense=Tense.PAST,
+            person="1s",
+            hebrew_form="כתבתי" * 10,
+            normalized_hebrew_form="",
+            transcription="katavti" * 10,
+        )
+        for i in range(100)
+    ]
+    user_settings = UserSettings(
+        user_id=123,
+        tense_settings=[
+            UserTenseSetting(user_id=123, tense=Tense.PAST, is_active=True)
+        ],
+    )
+
+    with patch("handlers.search.UnitOfWork") as mock_uow_class:
+        mock_uow = mock_uow_class.return_value.__enter__.return_value
+        mock_uow.words.get_word_by_id.return_value = MagicMock(
+            hebrew="לכתוב", conjugations=mock_conjugations
+        )
+        mock_uow.user_settings.get_user_settings.return_value = user_settings
+
+        await show_verb_conjugations(update, context)
+
+        message_text = update.callback_query.edit_message_text.call_args.args[0]
+        assert len(message_text) == 4090 + len("\n(...)")
+        assert message_text.endswith("\n(...)")
+        assert message_text.startswith("Спряжения для *לכתוב*:")
+
+
 @pytest.mark.asyncio
 async def test_show_verb_conjugations_all_hidden():
     """Тест: отображается корректное сообщение, если все времена скрыты."""
@@ -1077,8 +1197,9 @@ async def test_show_verb_conjugations_all_hidden():
 
     with patch("handlers.search.UnitOfWork") as mock_uow_class:
         mock_uow = mock_uow_class.return_value.__enter__.return_value
-        mock_uow.words.get_word_hebrew_by_id.return_value = "לכתוב"
-        mock_uow.words.get_conjugations_for_word.return_value = [MagicMock()]
+        mock_uow.words.get_word_by_id.return_value = MagicMock(
+            hebrew="לכתוב", conjugations=[MagicMock()]
+        )
         mock_uow.user_settings.get_user_settings.return_value = user_settings
         mock_uow.user_settings.get_tense_settings.return_value = {}
 
@@ -1097,7 +1218,7 @@ async def test_show_verb_conjugations_not_found():
 
     with patch("handlers.search.UnitOfWork") as mock_uow_class:
         mock_uow_instance = mock_uow_class.return_value.__enter__.return_value
-        mock_uow_instance.words.get_conjugations_for_word.return_value = []
+        mock_uow_instance.words.get_word_by_id.return_value.conjugations = []
 
         await show_verb_conjugations(update, context)
 
@@ -1361,17 +1482,22 @@ async def test_start_verb_trainer_happy_path():
 
     with patch("handlers.training.UnitOfWork") as mock_uow_class:
         mock_uow_instance = mock_uow_class.return_value.__enter__.return_value
-        mock_uow_instance.words.get_random_verb_for_training.return_value = mock_verb
-        mock_uow_instance.words.get_random_conjugation_for_word.return_value = (
-            mock_conjugation
+        mock_uow_instance.words.get_random_verb_training_item.return_value = (
+            mock_verb,
+            mock_conjugation,
+        )
+        mock_uow_instance.user_settings.get_user_settings.return_value = (
+            mock_empty_user_settings
+        )
+        # Инициализация возвращает созданные настройки, повторного чтения нет
+        mock_uow_instance.user_settings.initialize_tense_settings.return_value = (
+            mock_good_user_settings.tense_settings
         )
-        mock_uow_instance.user_settings.get_user_settings.side_effect = [
-            mock_empty_user_settings,
-            mock_good_user_settings,
-        ]
 
         await start_verb_trainer(update, context)
 
+        mock_uow_instance.user_settings.get_user_settings.assert_called_once_with(123)
+
         # Проверяем, что правильные данные сохранились
         assert context.user_data["answer"] == mock_conjugation
 
@@ -1423,8 +1549,8 @@ async def test_start_verb_trainer_no_active_tenses():
 
 
 @pytest.mark.asyncio
-async def test_start_verb_trainer_retry_logic():
-    """Тест: тренажер глаголов находит спряжение со второй попытки."""
+async def test_start_verb_trainer_uses_active_tenses():
+    """Тест: тренажер глаголов выбирает глагол и форму одним вызовом по активным временам."""
     update = AsyncMock()
     update.callback_query.from_user.id = 123
     context = MagicMock()
@@ -1439,12 +1565,6 @@ async def test_start_verb_trainer_retry_logic():
         transcription="рацим",
         word_id=12,
     )
-    mock_verb_no_conj = CachedWord(
-        word_id=11,
-        hebrew="פועל_בלי_כלום",
-        normalized_hebrew="פועל_בלי_כלום",
-        fetched_at=datetime.now(),
-    )
     mock_verb_with_conj = CachedWord(
         word_id=12,
         hebrew="לרוץ",
@@ -1452,64 +1572,53 @@ async def test_start_verb_trainer_retry_logic():
         conjugations=[mock_conjugation],
         fetched_at=datetime.now(),
     )
+    user_settings = UserSettings(
+        user_id=123,
+        tense_settings=[
+            UserTenseSetting(user_id=123, tense=Tense.PRESENT, is_active=True),
+            UserTenseSetting(user_id=123, tense=Tense.PAST, is_active=False),
+        ],
+    )
 
     with patch("handlers.training.UnitOfWork") as mock_uow_class:
         mock_uow_instance = mock_uow_class.return_value.__enter__.return_value
-        # Первый вызов возвращает глагол без спряжений, второй - с ними
-        mock_uow_instance.words.get_random_verb_for_training.side_effect = [
-            mock_verb_no_conj,
+        mock_uow_instance.user_settings.get_user_settings.return_value = user_settings
+        mock_uow_instance.words.get_random_verb_training_item.return_value = (
             mock_verb_with_conj,
-        ]
-        # Первый вызов не находит спряжений, второй - находит
-        mock_uow_instance.words.get_random_conjugation_for_word.side_effect = [
-            None,
             mock_conjugation,
-        ]
+        )
 
         await start_verb_trainer(update, context)
 
-        # Проверяем, что мы дважды пытались найти глагол
-        assert mock_uow_instance.words.get_random_verb_for_training.call_count == 2
-        # И дважды пытались найти спряжение
-        assert mock_uow_instance.words.get_random_conjugation_for_word.call_count == 2
+        mock_uow_instance.words.get_random_verb_training_item.assert_called_once_with(
+            123, ("ap",)
+        )
+        # Глагол найден - проверять наличие глаголов отдельно не нужно
+        mock_uow_instance.words.count_user_verbs.assert_not_called()
 
-        # Проверяем, что в итоге пользователю показали второй, "удачный" глагол
         update.callback_query.edit_message_text.assert_called_once()
-
-        # ИСПРАВЛЕНО: Обращаемся к позиционному аргументу args[0]
         call_text = update.callback_query.edit_message_text.call_args.args[0]
         assert "Глагол: *לרוץ*" in call_text
         assert "Настоящее, 1 л., мн.ч. (мы)" in call_text
+        assert context.user_data["answer"] == mock_conjugation
 
 
 @pytest.mark.asyncio
-async def test_start_verb_trainer_fails_after_retries():
-    """Тест: тренажер глаголов не находит спряжений после всех попыток."""
+async def test_start_verb_trainer_no_conjugations_in_active_tenses():
+    """Тест: у глаголов пользователя нет форм в выбранных временах."""
     update = AsyncMock()
     update.callback_query.from_user.id = 123
     context = MagicMock()
 
-    mock_verb = CachedWord(
-        word_id=11,
-        hebrew="פועל_בלי_כלום",
-        normalized_hebrew="",
-        fetched_at=datetime.now(),
-    )
-
     with patch("handlers.training.UnitOfWork") as mock_uow_class:
         mock_uow_instance = mock_uow_class.return_value.__enter__.return_value
-        # Всегда возвращаем один и тот же глагол
-        mock_uow_instance.words.get_random_verb_for_training.return_value = mock_verb
-        # Но для него никогда не находится спряжений
-        mock_uow_instance.words.get_random_conjugation_for_word.return_value = None
+        # Глаголы в словаре есть, но подходящих форм у них нет
+        mock_uow_instance.words.get_random_verb_training_item.return_value = None
+        mock_uow_instance.words.count_user_verbs.return_value = 2
 
         await start_verb_trainer(update, context)
 
-        # Проверяем, что было сделано ровно VERB_TRAINER_RETRY_ATTEMPTS попыток
-        assert (
-            mock_uow_instance.words.get_random_verb_for_training.call_count
-            == VERB_TRAINER_RETRY_ATTEMPTS
-        )
+        mock_uow_instance.words.get_random_verb_training_item.assert_called_once()
 
         # Проверяем, что было отправлено сообщение об ошибке
         update.callback_query.edit_message_text.assert_called_once()
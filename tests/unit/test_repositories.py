@@ -65,6 +65,57 @@ def test_word_repository(db_session):
     assert found_word.conjugations[0].hebrew_form == "כּוֹתֵב"
 
 
+def test_create_cached_words_bulk(db_session):
+    """Тестирует пакетное сохранение нескольких слов."""
+    connection = db_session
+    repo = WordRepository(connection)
+
+    verb = CreateVerb(
+        hebrew="לִקְרוֹא",
+        normalized_hebrew="לקרוא",
+        transcription="likro",
+        part_of_speech=PartOfSpeech.VERB,
+        root="ק-ר-א",
+        binyan=Binyan.PAAL,
+        translations=[CreateTranslation(translation_text="to read", is_primary=True)],
+        conjugations=[
+            CreateVerbConjugation(
+                tense=Tense.PRESENT,
+                person=Person.MS,
+                hebrew_form="קוֹרֵא",
+                normalized_hebrew_form="קורא",
+                transcription="kore",
+            )
+        ],
+    )
+    noun = CreateNoun(
+        hebrew="מַחְבֶּרֶת",
+        normalized_hebrew="מחברת",
+        transcription="machberet",
+        part_of_speech=PartOfSpeech.NOUN,
+        translations=[
+            CreateTranslation(translation_text="notebook", is_primary=True),
+            CreateTranslation(translation_text="copybook", is_primary=False),
+        ],
+    )
+
+    with connection:
+        verb_id, noun_id = repo.create_cached_words([verb, noun])
+
+    found_verb = repo.get_word_by_id(verb_id)
+    assert found_verb.hebrew == "לִקְרוֹא"
+    assert [t.translation_text for t in found_verb.translations] == ["to read"]
+    assert [c.hebrew_form for c in found_verb.conjugations] == ["קוֹרֵא"]
+
+    found_noun = repo.get_word_by_id(noun_id)
+    assert found_noun.hebrew == "מַחְבֶּרֶת"
+    assert [t.translation_text for t in found_noun.translations] == [
+        "notebook",
+        "copybook",
+    ]
+    assert found_noun.conjugations == []
+
+
 def test_srs_level_management(db_session):
     """Тестирует управление SRS-уровнем слова."""
     connection = db_session
@@ -97,34 +148,44 @@ def test_srs_level_management(db_session):
     assert retrieved_srs_level == srs_level
 
 
-def test_get_random_verb_for_training(db_session):
-    """Тестирует получение случайного глагола для тренировки."""
+def test_get_random_verb_training_item(db_session):
+    """Тестирует выбор глагола и формы в активных временах одним запросом."""
     connection = db_session
     word_repo = WordRepository(connection)
     user_repo = UserDictionaryRepository(connection)
-    user_id = 456
+    user_id = 457
 
     with connection:
         user_repo.add_user(user_id, "Train", "User")
-        verb_to_create = CreateVerb(
-            hebrew="לִלְמוֹד",
-            normalized_hebrew="ללמוד",
-            transcription="lilmod",
-            part_of_speech=PartOfSpeech.VERB,
-            root="ל-מ-ד",
-            binyan=Binyan.PAAL,
-            translations=[
-                CreateTranslation(translation_text="to learn", is_primary=True)
-            ],
+        verb_id = word_repo.create_cached_word(
+            CreateVerb(
+                hebrew="לָרוּץ",
+                normalized_hebrew="לרוץ",
+                transcription="larutz",
+                part_of_speech=PartOfSpeech.VERB,
+                translations=[],
+                conjugations=[
+                    CreateVerbConjugation(
+                        tense=Tense.PRESENT,
+                        person=Person.MS,
+                        hebrew_form="רָץ",
+                        normalized_hebrew_form="רץ",
+                        transcription="ratz",
+                    )
+                ],
+            )
         )
-        verb_id = word_repo.create_cached_word(verb_to_create)
         user_repo.add_word_to_dictionary(user_id, verb_id)
 
-    random_verb = word_repo.get_random_verb_for_training(user_id)
+    verb, conjugation = word_repo.get_random_verb_training_item(
+        user_id, (Tense.PRESENT.value,)
+    )
+    assert verb.word_id == verb_id
+    assert conjugation.hebrew_form == "רָץ"
 
-    assert random_verb is not None
-    assert random_verb.word_id == verb_id
-    assert random_verb.part_of_speech == "verb"
+    # Нет форм в выбранных временах - глагол не подходит, но он есть
+    assert word_repo.get_random_verb_training_item(user_id, (Tense.PAST.value,)) is None
+    assert word_repo.count_user_verbs(user_id) == 1
 
 
 def test_find_words_by_normalized_form(db_session):
@@ -178,6 +239,76 @@ def test_get_word_by_id(db_session):
     assert found_word.translations[0].translation_text == "to test"
 
 
+def test_get_word_by_id_with_translations_and_conjugations(db_session):
+    """Тестирует, что JOIN-запрос не дублирует переводы и спряжения."""
+    connection = db_session
+    repo = WordRepository(connection)
+
+    with connection:
+        word_to_create = CreateVerb(
+            hebrew="לִלְמוֹד",
+            normalized_hebrew="ללמוד",
+            transcription="lilmod",
+            part_of_speech=PartOfSpeech.VERB,
+            binyan=Binyan.PAAL,
+            translations=[
+                CreateTranslation(translation_text="to study", is_primary=False),
+                CreateTranslation(translation_text="to learn", is_primary=True),
+            ],
+            conjugations=[
+                CreateVerbConjugation(
+                    tense=Tense.PRESENT,
+                    person=Person.MS,
+                    hebrew_form="לוֹמֵד",
+                    normalized_hebrew_form="לומד",
+                    transcription="lomed",
+                ),
+                CreateVerbConjugation(
+                    tense=Tense.PAST,
+                    person=Person.S1,
+                    hebrew_form="לָמַדְתִּי",
+                    normalized_hebrew_form="למדתי",
+                    transcription="lamadti",
+                ),
+            ],
+        )
+        word_id = repo.create_cached_word(word_to_create)
+
+    found_word = repo.get_word_by_id(word_id)
+
+    assert [t.translation_text for t in found_word.translations] == [
+        "to learn",
+        "to study",
+    ]
+    assert [c.hebrew_form for c in found_word.conjugations] == ["לוֹמֵד", "לָמַדְתִּי"]
+    assert found_word.conjugations[0].tense == Tense.PRESENT
+    assert found_word.conjugations[1].transcription == "lamadti"
+    assert found_word.transcription == "lilmod"
+
+
+def test_get_word_by_id_uses_cache(db_session):
+    """Тестирует, что повторный запрос слова по ID берется из кэша."""
+    connection = db_session
+    repo = WordRepository(connection)
+
+    with connection:
+        word_to_create = CreateNoun(
+            hebrew="סֵפֶר",
+            normalized_hebrew="ספר",
+            transcription="sefer",
+            part_of_speech=PartOfSpeech.NOUN,
+            translations=[CreateTranslation(translation_text="book", is_primary=True)],
+        )
+        word_id = repo.create_cached_word(word_to_create)
+
+    first = repo.get_word_by_id(word_id)
+    hits_before = WordRepository.cache_info().hits
+    second = repo.get_word_by_id(word_id)
+
+    assert second is first
+    assert WordRepository.cache_info().hits == hits_before + 1
+
+
 def test_user_dictionary_repository(db_session):
     """Тестирует полный цикл операций со словарём пользователя."""
     connection = db_session
@@ -212,6 +343,97 @@ def test_user_dictionary_repository(db_session):
     assert len(page_after_delete) == 0
 
 
+def test_add_words_to_dictionary(db_session):
+    """Тестирует пакетное добавление слов в словарь пользователя."""
+    connection = db_session
+    word_repo = WordRepository(connection)
+    user_repo = UserDictionaryRepository(connection)
+    user_id = 107
+
+    with connection:
+        user_repo.add_user(user_id, "Batch", "batch_user")
+        word_ids = word_repo.create_cached_words(
+            [
+                CreateNoun(
+                    hebrew=hebrew,
+                    normalized_hebrew=hebrew,
+                    transcription=hebrew,
+                    part_of_speech=PartOfSpeech.NOUN,
+                    translations=[],
+                )
+                for hebrew in ("גַּן", "עֵץ")
+            ]
+        )
+        user_repo.add_words_to_dictionary(user_id, word_ids)
+        # Повторное добавление не создает дубликатов
+        user_repo.add_words_to_dictionary(user_id, word_ids)
+
+    page = user_repo.get_dictionary_page(user_id, 0, 10)
+    assert sorted(word.word_id for word in page) == sorted(word_ids)
+
+
+def test_are_words_in_dictionary(db_session):
+    """Тестирует пакетную проверку наличия слов в словаре."""
+    connection = db_session
+    word_repo = WordRepository(connection)
+    user_repo = UserDictionaryRepository(connection)
+    user_id = 108
+
+    with connection:
+        user_repo.add_user(user_id, "Batch", "batch_user")
+        word_ids = word_repo.create_cached_words(
+            [
+                CreateNoun(
+                    hebrew=hebrew,
+                    normalized_hebrew=hebrew,
+                    transcription=hebrew,
+                    part_of_speech=PartOfSpeech.NOUN,
+                    translations=[],
+                )
+                for hebrew in ("יָם", "הַר")
+            ]
+        )
+        user_repo.add_word_to_dictionary(user_id, word_ids[0])
+
+    assert user_repo.are_words_in_dictionary(user_id, word_ids) == {word_ids[0]}
+    assert user_repo.are_words_in_dictionary(user_id, []) == set()
+
+
+def test_get_dictionary_page_is_stable_for_same_added_at(db_session):
+    """
+    Тестирует пагинацию словаря, когда слова добавлены в одной транзакции
+    (одинаковый added_at): страницы не пересекаются и не теряют слов.
+    """
+    connection = db_session
+    word_repo = WordRepository(connection)
+    user_repo = UserDictionaryRepository(connection)
+    user_id = 202
+
+    user_repo.add_user(user_id, "Pager", None)
+    word_ids = []
+    for hebrew in ("אחד", "שניים", "שלושה"):
+        word_id = word_repo.create_cached_word(
+            CreateNoun(
+                hebrew=hebrew,
+                normalized_hebrew=hebrew,
+                transcription=None,
+                part_of_speech=PartOfSpeech.NOUN,
+                translations=[
+                    CreateTranslation(translation_text=hebrew, is_primary=True)
+                ],
+            )
+        )
+        user_repo.add_word_to_dictionary(user_id, word_id)
+        word_ids.append(word_id)
+
+    first_page = user_repo.get_dictionary_page(user_id, 0, 2)
+    second_page = user_repo.get_dictionary_page(user_id, 1, 2)
+
+    # Страница возвращает page_size + 1 слов, чтобы определить наличие следующей
+    assert [w.word_id for w in first_page] == word_ids[::-1]
+    assert [w.word_id for w in second_page] == word_ids[:1]
+
+
 def test_word_repository_transaction_rollback(db_session):
     """Тестирует, что транзакция откатывается при ошибке."""
     connection = db_session
@@ -238,6 +460,72 @@ def test_word_repository_transaction_rollback(db_session):
     assert not found_word, "Слово не должно было быть создано из-за отката транзакции."
 
 
+def test_word_cache_filled_only_after_commit(db_session):
+    """Слова, прочитанные в откаченной транзакции, не попадают в кэш."""
+    word_to_create = CreateNoun(
+        hebrew="עִפָּרוֹן",
+        normalized_hebrew="עפרון",
+        transcription="iparon",
+        part_of_speech=PartOfSpeech.NOUN,
+        translations=[CreateTranslation(translation_text="pencil", is_primary=True)],
+    )
+
+    with pytest.raises(RuntimeError):
+        with UnitOfWork() as uow:
+            word_id = uow.words.create_cached_word(word_to_create)
+            assert uow.words.find_words_by_normalized_form("עפרון")
+            raise RuntimeError("rollback")
+
+    repo = WordRepository(db_session)
+    assert repo.get_word_by_id(word_id) is None
+    assert repo.find_words_by_normalized_form("עפרון") == []
+
+
+def test_word_form_cache_reset_after_commit(patch_db_url):
+    """
+    Чтение на другом соединении между вставкой и коммитом не оставляет
+    в кэше форм результат без нового слова.
+    """
+    with UnitOfWork() as uow:
+        verb_id = uow.words.create_cached_word(
+            CreateVerb(
+                hebrew="לִכְתּוֹב",
+                normalized_hebrew="לכתוב",
+                transcription="likhtov",
+                part_of_speech=PartOfSpeech.VERB,
+                translations=[],
+                conjugations=[
+                    CreateVerbConjugation(
+                        tense=Tense.PRESENT,
+                        person=Person.MS,
+                        hebrew_form="כּוֹתֵב",
+                        normalized_hebrew_form="כותב",
+                        transcription="kotev",
+                    )
+                ],
+            )
+        )
+
+    with UnitOfWork() as writer:
+        noun_id = writer.words.create_cached_word(
+            CreateNoun(
+                hebrew="כּוֹתֵב",
+                normalized_hebrew="כותב",
+                transcription="kotev",
+                part_of_speech=PartOfSpeech.NOUN,
+                translations=[],
+            )
+        )
+        # Читатель еще не видит новое слово и кэширует старый результат
+        with UnitOfWork() as reader:
+            found = reader.words.find_words_by_normalized_form("כותב")
+            assert [word.word_id for word in found] == [verb_id]
+
+    with UnitOfWork() as uow:
+        found = uow.words.find_words_by_normalized_form("כותב")
+    assert sorted(word.word_id for word in found) == sorted([verb_id, noun_id])
+
+
 def test_optimized_word_selection_for_training(db_session):
     """
     Тестирует оптимизированную выборку слов (включая глаголы).
@@ -57,6 +57,9 @@ async def test_settings_menu(monkeypatch):
         keyboard_on = call_kwargs_on["reply_markup"].inline_keyboard
         assert "🔄 Продвинутый режим: ✅ Вкл" in keyboard_on[1][0].text
 
+        # Недостающие настройки времен досоздаются при каждом открытии меню
+        assert mock_uow.user_settings.initialize_tense_settings.call_count == 2
+
 
 @pytest.mark.asyncio
 async def test_toggle_training_mode_handler():
@@ -105,16 +108,17 @@ async def test_manage_tenses_menu_initialization():
 
     with patch("handlers.settings.UnitOfWork") as mock_uow_class:
         mock_uow = mock_uow_class.return_value.__enter__.return_value
-        # Сначала настроек нет, потом они появляются после инициализации
-        mock_uow.user_settings.get_user_settings.side_effect = [
-            empty_settings_model,
-            default_settings_model,
-        ]
+        # Настроек нет; инициализация сразу возвращает созданные строки
+        mock_uow.user_settings.get_user_settings.return_value = empty_settings_model
+        mock_uow.user_settings.initialize_tense_settings.return_value = (
+            default_settings_model.tense_settings
+        )
 
         await manage_tenses_menu(update, context)
 
-        # Проверяем, что была вызвана инициализация
+        # Проверяем, что была вызвана инициализация без повторного чтения
         mock_uow.user_settings.initialize_tense_settings.assert_called_once_with(123)
+        mock_uow.user_settings.get_user_settings.assert_called_once_with(123)
         mock_uow.commit.assert_called_once()
 
         # Проверяем, что меню было отрисовано
@@ -125,6 +129,38 @@ async def test_manage_tenses_menu_initialization():
         assert "⬜️ Повелительное" in keyboard[3][0].text
 
 
+@pytest.mark.asyncio
+async def test_manage_tenses_menu_rereads_settings_created_concurrently():
+    """Тест: если настройки параллельно создал другой запрос, они перечитываются."""
+    update = AsyncMock()
+    update.callback_query.from_user.id = 123
+    context = MagicMock()
+
+    concurrent_settings = UserSettings(
+        user_id=123,
+        tense_settings=[
+            UserTenseSetting(user_id=123, tense=Tense.PAST, is_active=True),
+        ],
+    )
+
+    with patch("handlers.settings.UnitOfWork") as mock_uow_class:
+        mock_uow = mock_uow_class.return_value.__enter__.return_value
+        mock_uow.user_settings.get_user_settings.side_effect = [
+            UserSettings(user_id=123),
+            concurrent_settings,
+        ]
+        # ON CONFLICT DO NOTHING ничего не вставил - RETURNING пуст
+        mock_uow.user_settings.initialize_tense_settings.return_value = []
+
+        await manage_tenses_menu(update, context)
+
+        assert mock_uow.user_settings.get_user_settings.call_count == 2
+        call_kwargs = update.callback_query.edit_message_text.call_args.kwargs
+        keyboard = call_kwargs["reply_markup"].inline_keyboard
+        # Показано меню времен, а не сообщение об отсутствии настроек
+        assert "✅ Прошедшее" in keyboard[0][0].text
+
+
 @pytest.mark.asyncio
 async def test_toggle_tense():
     """Тест: нажатие на кнопку времени вызывает обновление в БД и перерисовку меню."""
@@ -12,9 +12,19 @@ def test_initialize_and_get_user_settings(
     """
     user_id = unique_user_id
 
-    # 1. Вызываем инициализацию
+    # 1. Вызываем инициализацию: созданные строки возвращаются сразу
     with user_settings_repo.connection:
-        user_settings_repo.initialize_tense_settings(user_id)
+        created = user_settings_repo.initialize_tense_settings(user_id)
+    assert {setting.tense.value for setting in created} == {
+        "perf",
+        "ap",
+        "impf",
+        "imp",
+    }
+
+    # Повторная инициализация ничего не вставляет и ничего не возвращает
+    with user_settings_repo.connection:
+        assert user_settings_repo.initialize_tense_settings(user_id) == []
 
     # 2. Получаем модель с настройками
     settings_model = user_settings_repo.get_user_settings(user_id)
@@ -1,4 +1,15 @@
-from utils import normalize_hebrew, parse_translations
+import asyncio
+
+import pytest
+
+from utils import (
+    _background_tasks,
+    fire_and_forget,
+    normalize_hebrew,
+    parse_callback_args,
+    parse_callback_int,
+    parse_translations,
+)
 
 
 def test_normalize_hebrew():
@@ -10,6 +21,15 @@ def test_normalize_hebrew():
     assert normalize_hebrew("abc") == "abc"
 
 
+def test_normalize_hebrew_is_cached():
+    normalize_hebrew.cache_clear()
+    normalize_hebrew("שָׁלוֹם")
+    normalize_hebrew("שָׁלוֹם")
+    info = normalize_hebrew.cache_info()
+    assert info.hits == 1
+    assert info.misses == 1
+
+
 def test_parse_translations():
     # Test case 1: Simple translation
     raw_text_1 = "hello, world"
@@ -44,3 +64,25 @@ def test_parse_translations():
     raw_text_5 = "(alone)"
     expected_5 = []
     assert parse_translations(raw_text_5) == expected_5
+
+
+def test_parse_callback_args():
+    assert parse_callback_args("dict:confirm_delete:15:2", 2) == ["15", "2"]
+    assert parse_callback_args("word:select:10:חלב", 2) == ["10", "חלב"]
+    assert parse_callback_args("settings:tense_toggle:imp", 1) == ["imp"]
+    assert parse_callback_int("verb:show:42") == 42
+
+
+@pytest.mark.asyncio
+async def test_fire_and_forget_keeps_task_until_done():
+    async def failing():
+        raise RuntimeError("boom")
+
+    task = fire_and_forget(failing())
+    assert task in _background_tasks
+
+    # Ошибка не пробрасывается вызывающему, задача освобождается
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    assert task.done()
+    assert task not in _background_tasks